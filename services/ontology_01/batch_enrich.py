@@ -196,53 +196,60 @@ def run_batch(
     _print_header()
     results = []
 
-    for n, stub in enumerate(to_process, 1):
-        cname = stub.get("canonical_name", "")
-        orig_meta = stub.get("meta_type", "other")
-
-        if no_llm:
-            # Search-only mode: just check if Serper finds anything
-            try:
-                sr = search_org(cname, use_cache=not force_search)
-                snippets = len(sr.get("snippets", []))
-                has_kg = bool(sr.get("knowledge_graph"))
-                proposals = _fallback_proposal(
+    try:
+        for n, stub in enumerate(to_process, 1):
+            cname = stub.get("canonical_name", "")
+            orig_meta = stub.get("meta_type", "other")
+
+            if no_llm:
+                # Search-only mode: just check if Serper finds anything
+                try:
+                    sr = search_org(cname, use_cache=not force_search)
+                    snippets = len(sr.get("snippets", []))
+                    has_kg = bool(sr.get("knowledge_graph"))
+                    proposals = _fallback_proposal(
+                        stub,
+                        reason=f"search-only mode | {snippets} snippets | KG={'yes' if has_kg else 'no'}",
+                    )
+                    proposals["enrichment_method"] = "serper_only"
+                    proposals["confidence"] = 0.5 if snippets > 0 else 0.1
+                except Exception as e:
+                    proposals = _fallback_proposal(stub, reason=f"Search failed: {e}")
+            else:
+                proposals = enrich_stub(
                     stub,
-                    reason=f"search-only mode | {snippets} snippets | KG={'yes' if has_kg else 'no'}",
+                    existing_tags_sample,
+                    use_cache=not force_search,
                 )
-                proposals["enrichment_method"] = "serper_only"
-                proposals["confidence"] = 0.5 if snippets > 0 else 0.1
-            except Exception as e:
-                proposals = _fallback_proposal(stub, reason=f"Search failed: {e}")
-        else:
-            proposals = enrich_stub(
-                stub,
-                existing_tags_sample,
-                use_cache=not force_search,
-            )
-
-        _print_row(n, cname, orig_meta, proposals)
-
-        if verbose:
-            _print_verbose(proposals)
-
-        result = {"name": cname, "orig_meta": orig_meta, "proposals": proposals}
-        results.append(result)
-
-        # Optionally write batch_proposals back to ontology entry
-        if write and db:
-            clean_proposals = {
-                k: v for k, v in proposals.items()
-                if k != "raw_search_results"
-            }
-            db.update_entry(cname, {"batch_proposals": clean_proposals})
-
-        # Progress indicator every 10
-        if n % 10 == 0:
-            print(f"\n  ... {n}/{total} processed ...\n")
-
-        if n < total and delay > 0:
-            time.sleep(delay)
+
+            _print_row(n, cname, orig_meta, proposals)
+
+            if verbose:
+                _print_verbose(proposals)
+
+            result = {"name": cname, "orig_meta": orig_meta, "proposals": proposals}
+            results.append(result)
+
+            # Optionally write batch_proposals back to ontology entry
+            if write and db:
+                clean_proposals = {
+                    k: v for k, v in proposals.items()
+                    if k != "raw_search_results"
+                }
+                db.update_entry(cname, {"batch_proposals": clean_proposals}, defer_write=True)
+
+            # Progress indicator (and checkpoint deferred writes) every 10
+            if n % 10 == 0:
+                if db:
+                    db.save(fsync=False)
+                print(f"\n  ... {n}/{total} processed ...\n")
+
+            if n < total and delay > 0:
+                time.sleep(delay)
+    finally:
+        # Flush whatever is left since the last checkpoint, even on Ctrl+C
+        if db:
+            db.save()
 
     return results
 
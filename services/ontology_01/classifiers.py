@@ -13,8 +13,10 @@ Seven categories (in priority order):
   7. other               — Award bodies, prizes, unclear
 """
 
+import hashlib
 import re
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Keyword rules — tested in priority order (un_system first, other last)
@@ -246,6 +248,20 @@ _PRIVATE_KEYWORDS = [
     "ubs ", "credit suisse",
 ]
 
+# Corporate-form suffixes from _PRIVATE_KEYWORDS. These almost always end the
+# name, so a single C-level endswith() confirms "private" without a scan.
+# They stay in _PRIVATE_KEYWORDS so mid-string forms ("Acme Ltd. (UK)") still match.
+_PRIVATE_SUFFIXES = (
+    " inc.", " inc,", " incorporated",
+    " corp.", " corporation",
+    " ltd.", " limited",
+    " llc", " llp",
+    " plc", " p.l.c",
+    " gmbh",
+    " s.a.", " s.a,",
+    " n.v.",
+)
+
 # Strings that start with a private keyword but should NOT be classified as private
 _PRIVATE_EXCLUSIONS = [
     "world bank",
@@ -264,29 +280,70 @@ _PRIVATE_EXCLUSIONS = [
     "european central bank",
 ]
 
+# Every exclusion is a "bank" phrase, so names without "bank" never need the
+# exclusion scan. Falls back to "" (always scan) if a non-bank exclusion is added.
+_EXCLUSION_GATE = "bank" if all("bank" in kw for kw in _PRIVATE_EXCLUSIONS) else ""
+
 _OTHER_KEYWORDS: List[str] = []  # default bucket — no positive keywords needed
 
 # ─────────────────────────────────────────────────────────────────────────────
-# Structural patterns (regex)
+# Keyword prefilter
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Categories in priority order, paired with their keyword lists
+_KEYWORD_RULES: List[Tuple[str, List[str]]] = [
+    ("un_system", _UN_KEYWORDS),
+    ("intergovernmental", _INTERGOVERNMENTAL_KEYWORDS),
+    ("national_government", _NATIONAL_GOV_KEYWORDS),
+    ("university", _UNIVERSITY_KEYWORDS),
+    ("ngo", _NGO_KEYWORDS),
+    ("private", _PRIVATE_KEYWORDS),
+]
+
+
+def _build_trigram_index(
+    rules: List[Tuple[str, List[str]]],
+) -> Dict[str, List[Tuple[int, str]]]:
+    """
+    Index every keyword by its leading 3-gram (all keywords are >= 3 chars).
+    A name can only contain a keyword if it also contains that 3-gram, so one
+    pass over the name's 3-grams yields the few keywords worth testing.
+    Values are (priority, keyword) where priority indexes into rules.
+    """
+    index: Dict[str, List[Tuple[int, str]]] = {}
+    for priority, (_category, keywords) in enumerate(rules):
+        for kw in keywords:
+            index.setdefault(kw[:3], []).append((priority, kw))
+    return index
+
+
+_TRIGRAM_INDEX = _build_trigram_index(_KEYWORD_RULES)
+_NO_MATCH = len(_KEYWORD_RULES)
+_PRIVATE_PRIORITY = _NO_MATCH - 1
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Structural patterns (regex) — matched against the lowercased name
 # ─────────────────────────────────────────────────────────────────────────────
 
 # "22nd Parliament of Turkey", "3rd National Assembly of..."
 _ORDINAL_PARLIAMENT_RE = re.compile(
     r"\b\d+(st|nd|rd|th)\s+(parliament|national assembly|legislative assembly)\b",
-    re.IGNORECASE,
 )
 
 # Names ending in "Prize", "Award", "Fellowship", "Medal" → other
 _AWARD_SUFFIX_RE = re.compile(
     r"\b(prize|award|fellowship|medal|scholarship|grant)\s*$",
-    re.IGNORECASE,
 )
 
 # Known award/prize givers: Nobel, Pulitzer, Guggenheim, Sloan, MacArthur, etc.
 _AWARD_GIVER_RE = re.compile(
     r"\b(nobel|pulitzer|guggenheim|sloan|macarthur|wolf |turing|fields medal"
     r"|lasker|templeton|ramón cajal|shaw prize|tang prize)\b",
-    re.IGNORECASE,
+)
+
+# Both award patterns map to "other" — search them as one alternation
+_AWARD_RE = re.compile(
+    f"(?:{_AWARD_SUFFIX_RE.pattern})|(?:{_AWARD_GIVER_RE.pattern})"
 )
 
 
@@ -299,45 +356,49 @@ def classify_by_keywords(raw_name: str) -> Optional[str]:
     Test raw_name against keyword lists in priority order.
     Returns the first matching category, or None if nothing matches.
     """
-    name_lower = raw_name.lower()
+    return _match_keywords(raw_name.lower())
 
-    def _matches(keywords: List[str]) -> bool:
-        return any(kw in name_lower for kw in keywords)
 
-    if _matches(_UN_KEYWORDS):
-        return "un_system"
+def _match_keywords(name_lower: str) -> Optional[str]:
+    """classify_by_keywords() on an already-lowercased name."""
+    index_get = _TRIGRAM_INDEX.get
 
-    if _matches(_INTERGOVERNMENTAL_KEYWORDS):
-        return "intergovernmental"
+    # Single sweep: keep the highest-priority category with a confirmed keyword.
+    # A corporate suffix confirms "private" up front, so the sweep only has to
+    # look for higher-priority categories.
+    best = _PRIVATE_PRIORITY if name_lower.endswith(_PRIVATE_SUFFIXES) else _NO_MATCH
+    for i in range(len(name_lower) - 2):
+        for priority, kw in index_get(name_lower[i:i + 3], ()):
+            if priority < best and kw in name_lower:
+                best = priority
+        if best == 0:
+            break
 
-    if _matches(_NATIONAL_GOV_KEYWORDS):
-        return "national_government"
-
-    if _matches(_UNIVERSITY_KEYWORDS):
-        return "university"
+    if best == _NO_MATCH:
+        return None
 
-    if _matches(_NGO_KEYWORDS):
-        return "ngo"
+    # Private — apply exclusions first (only bank names can hit one)
+    if best == _PRIVATE_PRIORITY and _EXCLUSION_GATE in name_lower:
+        for kw in _PRIVATE_EXCLUSIONS:
+            if kw in name_lower:
+                return None
 
-    # Private — apply exclusions first
-    if _matches(_PRIVATE_KEYWORDS):
-        if not _matches(_PRIVATE_EXCLUSIONS):
-            return "private"
-
-    return None
+    return _KEYWORD_RULES[best][0]
 
 
 def classify_by_structure(raw_name: str) -> Optional[str]:
     """
     Pattern-based classification for cases keyword rules miss.
     """
-    if _ORDINAL_PARLIAMENT_RE.search(raw_name):
-        return "national_government"
+    return _match_structure(raw_name.lower())
 
-    if _AWARD_SUFFIX_RE.search(raw_name):
-        return "other"
 
-    if _AWARD_GIVER_RE.search(raw_name):
+def _match_structure(name_lower: str) -> Optional[str]:
+    """classify_by_structure() on an already-lowercased name."""
+    if _ORDINAL_PARLIAMENT_RE.search(name_lower):
+        return "national_government"
+
+    if _AWARD_RE.search(name_lower):
         return "other"
 
     return None
@@ -352,20 +413,44 @@ def classify_org(raw_name: str) -> str:
     if not raw_name or not raw_name.strip():
         return "other"
 
-    result = classify_by_keywords(raw_name)
+    # Lowercase once; both rule stages work on the same string
+    name_lower = raw_name.lower()
+
+    result = _match_keywords(name_lower)
     if result:
         return result
 
-    result = classify_by_structure(raw_name)
+    result = _match_structure(name_lower)
     if result:
         return result
 
     return "other"
 
 
-def classify_batch(raw_names: List[str]) -> Dict[str, str]:
-    """Classify a list of org names. Returns {raw_name -> category}."""
-    return {name: classify_org(name) for name in raw_names}
+# Below this many distinct names, process-pool startup costs more than it saves
+_PARALLEL_MIN_BATCH = 1000
+
+
+def classify_batch(
+    raw_names: List[str],
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Classify a list of org names. Returns {raw_name -> category}.
+
+    Each distinct name is classified once. Pass max_workers to spread large
+    batches across processes — classification is pure-Python CPU work, so a
+    thread pool would just serialize on the GIL.
+    """
+    unique_names = list(dict.fromkeys(raw_names))
+
+    if max_workers and max_workers > 1 and len(unique_names) >= _PARALLEL_MIN_BATCH:
+        chunksize = max(1, len(unique_names) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            categories = executor.map(classify_org, unique_names, chunksize=chunksize)
+            return dict(zip(unique_names, categories))
+
+    return {name: classify_org(name) for name in unique_names}
 
 
 # Category → meta_type mapping (used by matcher and run_matching)
@@ -411,3 +496,15 @@ CATEGORY_TO_SECTOR: Dict[str, str] = {
     "private": "private",
     "other": "other",
 }
+
+# Changes whenever the rule tables or category mappings above change, so
+# caches of classify_org()-dependent results (matcher's result store) miss
+CLASSIFIER_FINGERPRINT = hashlib.sha256(repr((
+    _KEYWORD_RULES,
+    _PRIVATE_SUFFIXES,
+    _PRIVATE_EXCLUSIONS,
+    _ORDINAL_PARLIAMENT_RE.pattern,
+    _AWARD_RE.pattern,
+    CATEGORY_TO_META_TYPE,
+    CATEGORY_TO_SEARCH_META_TYPE,
+)).encode("utf-8")).hexdigest()[:16]
@@ -5,7 +5,11 @@ Optional/fallback tier — skipped gracefully if no Cohere API key is available.
 Only called when fuzzy matching fails or returns a below-threshold score.
 """
 
+import functools
+import hashlib
 import os
+import sqlite3
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -13,7 +17,9 @@ import numpy as np
 from dotenv import load_dotenv
 
 # Load .env from project root
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_SERVICE_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SERVICE_DIR.parent.parent
+_QUERY_CACHE_FILE = _SERVICE_DIR / "query_embedding_cache.sqlite"
 load_dotenv(_PROJECT_ROOT / ".env")
 
 EMBED_MODEL = "embed-english-v3.0"
@@ -21,6 +27,53 @@ EMBED_INPUT_TYPE_DOCUMENT = "search_document"
 EMBED_INPUT_TYPE_QUERY = "search_query"
 EMBED_BATCH_SIZE = 96  # Cohere's max per request
 DEFAULT_SIMILARITY_THRESHOLD = 0.82
+QUERY_CACHE_SIZE = 10000  # in-memory LRU of query embeddings
+
+
+class _QueryEmbeddingStore:
+    """
+    On-disk tier for query embeddings: sqlite rows of (model, text) -> float32
+    bytes. Shared across matcher threads; cache failure is non-fatal.
+    """
+
+    def __init__(self, path: Path = _QUERY_CACHE_FILE):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings "
+                "(model TEXT, text TEXT, vec BLOB, PRIMARY KEY (model, text))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT vec FROM query_embeddings WHERE model = ? AND text = ?",
+                    (EMBED_MODEL, text),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+
+    def put(self, text: str, vec: np.ndarray) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (model, text, vec) "
+                    "VALUES (?, ?, ?)",
+                    (EMBED_MODEL, text, np.asarray(vec, dtype=np.float32).tobytes()),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
 
 
 class EmbeddingMatcher:
@@ -39,6 +92,10 @@ class EmbeddingMatcher:
         self._ontology_embeddings: Optional[np.ndarray] = None
         self._ontology_entries: List[Dict] = []
         self._ontology_strings: List[str] = []  # the strings that were embedded
+        self._query_store = _QueryEmbeddingStore()
+        self._embed_query_cached = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(
+            self._embed_query_uncached
+        )
 
     def is_available(self) -> bool:
         """Return True if Cohere API key is set and cohere package is importable."""
@@ -92,6 +149,21 @@ class EmbeddingMatcher:
 
         return np.array(all_embeddings, dtype=np.float32)
 
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a single query string. Returns a read-only 1D float32 vector.
+        Cached in memory (LRU) and on disk, keyed by (model, stripped text).
+        """
+        return self._embed_query_cached(text.strip())
+
+    def _embed_query_uncached(self, text: str) -> np.ndarray:
+        vec = self._query_store.get(text)
+        if vec is None:
+            vec = self._embed_texts([text], EMBED_INPUT_TYPE_QUERY)[0]
+            self._query_store.put(text, vec)
+        vec.flags.writeable = False  # shared by every caller of the cache
+        return vec
+
     def _entry_to_string(self, entry: Dict) -> str:
         """
         Build the string to embed for an ontology entry.
@@ -102,11 +174,16 @@ class EmbeddingMatcher:
         parts.extend(variations[:2])
         return " | ".join(p for p in parts if p)
 
-    def build_ontology_index(self, entries: List[Dict]) -> None:
+    def build_ontology_index(
+        self,
+        entries: List[Dict],
+        cache_path: Optional[Path] = None,
+    ) -> None:
         """
         Embed all provided entries and cache the embedding matrix.
         Call this once per meta_type subset before calling find_similar().
-        This is expensive — results are cached in memory.
+        This is expensive — results are cached in memory, and on disk at
+        cache_path if given (reused only when the embedded strings match).
         """
         if not entries:
             self._ontology_embeddings = np.empty((0, 0), dtype=np.float32)
@@ -115,32 +192,94 @@ class EmbeddingMatcher:
             return
 
         strings = [self._entry_to_string(e) for e in entries]
-        embeddings = self._embed_texts(strings, EMBED_INPUT_TYPE_DOCUMENT)
+
+        if cache_path is not None:
+            digest = hashlib.sha256(
+                "\x1f".join([EMBED_MODEL] + strings).encode("utf-8")
+            ).hexdigest()
+            cached = self._load_index_cache(cache_path, digest, len(strings))
+            if cached is not None:
+                self._ontology_entries = entries
+                self._ontology_strings = strings
+                self._ontology_embeddings = cached
+                return
+
+        # Identical rendered strings embed identically — send each one only once
+        unique_strings = list(dict.fromkeys(strings))
+        if len(unique_strings) < len(strings):
+            position = {s: i for i, s in enumerate(unique_strings)}
+            unique_embeddings = self._embed_texts(unique_strings, EMBED_INPUT_TYPE_DOCUMENT)
+            embeddings = unique_embeddings[[position[s] for s in strings]]
+        else:
+            embeddings = self._embed_texts(strings, EMBED_INPUT_TYPE_DOCUMENT)
 
         self._ontology_entries = entries
         self._ontology_strings = strings
-        self._ontology_embeddings = embeddings
+        self._ontology_embeddings = self._normalize_rows(embeddings)
+
+        if cache_path is not None:
+            try:
+                with open(cache_path, "wb") as f:
+                    np.savez(f, digest=np.array(digest), embeddings=self._ontology_embeddings)
+            except OSError:
+                pass  # cache failure is non-fatal
+
+    @staticmethod
+    def _load_index_cache(path: Path, digest: str, n_rows: int) -> Optional[np.ndarray]:
+        """Return the cached (normalized) index if it was built from the same strings."""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path) as data:
+                if str(data["digest"]) != digest:
+                    return None
+                embeddings = data["embeddings"]
+        except (OSError, ValueError, KeyError):
+            return None
+        if len(embeddings) != n_rows:
+            return None
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
-    def _cosine_similarity(self, query_vec: np.ndarray, doc_matrix: np.ndarray) -> np.ndarray:
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
         """
-        Compute cosine similarity between a query vector and a matrix of document vectors.
-        Returns 1D array of scores in [-1, 1].
+        Scale each row to unit length and store C-contiguous float32, so cosine
+        scoring against the index is a single matrix-vector product.
+        Zero-norm rows stay zero.
         """
-        query_norm = np.linalg.norm(query_vec)
-        doc_norms = np.linalg.norm(doc_matrix, axis=1)
+        norms = EmbeddingMatcher._row_norms(matrix)[:, np.newaxis]
+        normalized = matrix / np.maximum(norms, 1e-10)
+        return np.ascontiguousarray(normalized, dtype=np.float32)
 
-        if query_norm == 0:
-            return np.zeros(len(doc_matrix))
+    @staticmethod
+    def _row_norms(matrix: np.ndarray) -> np.ndarray:
+        """L2 norm of each row — einsum fuses square and sum into one pass."""
+        return np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
 
-        # Avoid division by zero for zero-norm doc vectors
-        safe_doc_norms = np.where(doc_norms == 0, 1e-10, doc_norms)
-        return np.dot(doc_matrix, query_vec) / (safe_doc_norms * query_norm)
+    def _score_query(
+        self,
+        query_vec: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Cosine similarity of query_vec against the (pre-normalized) ontology index.
+        Returns 1D array of scores in [-1, 1]; entries excluded by mask get -inf.
+        """
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm == 0:
+            scores = np.zeros(len(self._ontology_embeddings), dtype=np.float32)
+        else:
+            scores = self._ontology_embeddings @ (query_vec / query_norm)
+        if mask is not None:
+            scores = np.where(mask, scores, -np.inf)
+        return scores
 
     def find_similar(
         self,
         raw_name: str,
         entries: Optional[List[Dict]] = None,
         threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        mask: Optional[np.ndarray] = None,
     ) -> Optional[Tuple[Dict, float]]:
         """
         Find the most semantically similar ontology entry to raw_name.
@@ -150,6 +289,8 @@ class EmbeddingMatcher:
             entries: optional list of entries to search; if provided and different
                      from the currently cached set, rebuilds the index
             threshold: cosine similarity threshold (0-1)
+            mask: optional boolean array over the indexed entries; only
+                  entries where it is True are considered
 
         Returns:
             (matched_entry, similarity_score) or None if below threshold
@@ -165,12 +306,26 @@ class EmbeddingMatcher:
                 or len(self._ontology_embeddings) == 0):
             return None
 
-        # Embed the query
-        query_embeddings = self._embed_texts([raw_name], EMBED_INPUT_TYPE_QUERY)
-        query_vec = query_embeddings[0]
+        return self.find_similar_vec(
+            self.embed_query(raw_name), threshold=threshold, mask=mask
+        )
+
+    def find_similar_vec(
+        self,
+        query_vec: np.ndarray,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        mask: Optional[np.ndarray] = None,
+    ) -> Optional[Tuple[Dict, float]]:
+        """
+        find_similar() for an already-embedded query (see embed_query()).
+        Searches the current index as-is.
+        """
+        if (self._ontology_embeddings is None
+                or len(self._ontology_embeddings) == 0):
+            return None
 
         # Compute similarities
-        similarities = self._cosine_similarity(query_vec, self._ontology_embeddings)
+        similarities = self._score_query(query_vec, mask)
         best_idx = int(np.argmax(similarities))
         best_score = float(similarities[best_idx])
 
@@ -185,10 +340,12 @@ class EmbeddingMatcher:
         entries: Optional[List[Dict]] = None,
         n: int = 5,
         min_score: float = 0.60,
+        mask: Optional[np.ndarray] = None,
     ) -> List[Tuple[Dict, float]]:
         """
         Return top-N most similar entries above min_score.
         Used by matcher.py to gather candidates for LLM disambiguation.
+        mask restricts the search as in find_similar().
 
         Returns: list of (entry, score) sorted by score descending.
         """
@@ -202,13 +359,33 @@ class EmbeddingMatcher:
                 or len(self._ontology_embeddings) == 0):
             return []
 
-        query_embeddings = self._embed_texts([raw_name], EMBED_INPUT_TYPE_QUERY)
-        query_vec = query_embeddings[0]
+        return self.find_top_n_vec(
+            self.embed_query(raw_name), n=n, min_score=min_score, mask=mask
+        )
 
-        similarities = self._cosine_similarity(query_vec, self._ontology_embeddings)
+    def find_top_n_vec(
+        self,
+        query_vec: np.ndarray,
+        n: int = 5,
+        min_score: float = 0.60,
+        mask: Optional[np.ndarray] = None,
+    ) -> List[Tuple[Dict, float]]:
+        """find_top_n() for an already-embedded query (see embed_query())."""
+        if (self._ontology_embeddings is None
+                or len(self._ontology_embeddings) == 0):
+            return []
 
-        # Get top-N indices
-        top_indices = np.argsort(similarities)[::-1][:n]
+        similarities = self._score_query(query_vec, mask)
+
+        # Get top-N indices — partition first so only the n survivors get sorted.
+        # Survivors with equal scores are ordered by index. Which entries survive
+        # a tie straddling the n-th place is up to argpartition, so with more
+        # than n entries tied at the top, top_indices[0] need not be np.argmax.
+        if 0 < n < len(similarities):
+            candidates = np.sort(np.argpartition(similarities, -n)[-n:])
+            top_indices = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        else:
+            top_indices = np.argsort(-similarities, kind="stable")[:n]
         results = []
         for idx in top_indices:
             score = float(similarities[idx])
@@ -7,6 +7,8 @@ Receives entry lists from OntologyDB — never loads JSON itself.
 import re
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 try:
     from rapidfuzz import fuzz, process as rfprocess
     RAPIDFUZZ_AVAILABLE = True
@@ -55,6 +57,17 @@ def normalize_for_fuzzy(name: str) -> str:
     return name.strip()
 
 
+_WORD_INITIAL_RE = re.compile(r"\b[a-z]")
+
+
+def _initials_bitmap(normalized: str) -> int:
+    """Bit i set if letter chr(ord('a') + i) starts a word in a normalized name."""
+    bits = 0
+    for ch in _WORD_INITIAL_RE.findall(normalized):
+        bits |= 1 << (ord(ch) - 97)
+    return bits
+
+
 _ACRONYM_RE = re.compile(r"\(([A-Z][A-Z0-9\-]{1,7})\)")
 
 
@@ -71,27 +84,6 @@ def extract_acronym(name: str) -> Optional[str]:
     return None
 
 
-# ─────────────────────────────────────────────────────────────────────────────
-# Candidate string building
-# ─────────────────────────────────────────────────────────────────────────────
-
-def _build_candidate_strings(entries: List[Dict]) -> List[Tuple[str, Dict, str]]:
-    """
-    Build a flat list of (normalized_string, entry_dict, field_label) tuples.
-    field_label is "canonical" or "variation".
-    Used for batch rapidfuzz scoring.
-    """
-    candidates = []
-    for entry in entries:
-        cname = entry.get("canonical_name", "")
-        if cname:
-            candidates.append((normalize_for_fuzzy(cname), entry, "canonical"))
-        for var in entry.get("variations_found", []):
-            if var:
-                candidates.append((normalize_for_fuzzy(var), entry, "variation"))
-    return candidates
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Core matching
 # ─────────────────────────────────────────────────────────────────────────────
@@ -118,72 +110,135 @@ def fuzzy_match_against_list(
     Returns:
         FuzzyMatchResult dict or None
     """
-    _check_rapidfuzz()
-
-    if not candidates:
-        return None
-
-    normalized_query = normalize_for_fuzzy(raw_name)
-    acronym = extract_acronym(raw_name)
-
-    # Build strings list for vectorized scoring
-    candidate_strings = _build_candidate_strings(candidates)
-    if not candidate_strings:
-        return None
-
-    strings_only = [cs[0] for cs in candidate_strings]
-
-    best_score = 0.0
-    best_idx = -1
-
-    # Primary scorer: token_sort_ratio (handles word order differences)
-    # e.g. "University of Zurich" vs "Zurich, University of"
-    scores_tsort = rfprocess.cdist(
-        [normalized_query], strings_only,
-        scorer=fuzz.token_sort_ratio,
-        score_cutoff=0,
-    )[0]
-
-    # Secondary scorer: WRatio (weighted combo — handles partial matches)
-    scores_wratio = rfprocess.cdist(
-        [normalized_query], strings_only,
-        scorer=fuzz.WRatio,
-        score_cutoff=0,
-    )[0]
-
-    # Take the max of both scorers per candidate
-    for i, (ts, wr) in enumerate(zip(scores_tsort, scores_wratio)):
-        combined = max(float(ts), float(wr))
-        if combined > best_score:
-            best_score = combined
-            best_idx = i
-
-    # Also try acronym scoring if present
-    if acronym:
-        acronym_norm = acronym.lower().strip()
-        scores_acro = rfprocess.cdist(
-            [acronym_norm], strings_only,
-            scorer=fuzz.token_sort_ratio,
-            score_cutoff=0,
-        )[0]
-        for i, score in enumerate(scores_acro):
-            if float(score) > best_score:
-                best_score = float(score)
-                best_idx = i
-
-    if best_score < threshold or best_idx < 0:
-        return None
-
-    matched_string, matched_entry, field_label = candidate_strings[best_idx]
-    match_method = f"fuzzy_{field_label}"  # "fuzzy_canonical" or "fuzzy_variation"
-
-    return {
-        "raw_name": raw_name,
-        "matched_entry": matched_entry,
-        "score": round(best_score, 2),
-        "match_method": match_method,
-        "matched_string": matched_string,
-    }
+    best, _ = FuzzyCandidateIndex(candidates).match_with_top_n(
+        raw_name, threshold=threshold, n=0
+    )
+    return best
+
+
+class FuzzyCandidateIndex:
+    """
+    Normalized candidate strings for a fixed entry list, built once.
+
+    Columnar layout: strings[k] belongs to entries[owner[k]] and is a
+    variation if is_variation[k] (else the canonical_name). Matching scores
+    all strings with cdist, then reduces per entry in numpy. This is the
+    only scorer: fuzzy_match_against_list() and fuzzy_top_n() wrap a one-off
+    index, so reuse an index to avoid re-normalizing every call.
+
+    With prefilter=True, strings whose length is outside [0.5, 2]x the
+    query's or that share no word-initial letter with it are skipped before
+    scoring. This is lossy: WRatio's partial matching can score a much longer
+    string highly.
+
+    Usage:
+        index = FuzzyCandidateIndex(db.get_by_meta_type("io"))
+        best, top = index.match_with_top_n("UNDP", threshold=80, n=5)
+    """
+
+    def __init__(self, entries: List[Dict]):
+        self.entries: List[Dict] = list(entries)
+        strings: List[str] = []
+        owner: List[int] = []
+        is_variation: List[bool] = []
+        for i, entry in enumerate(self.entries):
+            cname = entry.get("canonical_name", "")
+            if cname:
+                strings.append(normalize_for_fuzzy(cname))
+                owner.append(i)
+                is_variation.append(False)
+            for var in entry.get("variations_found", []):
+                if var:
+                    strings.append(normalize_for_fuzzy(var))
+                    owner.append(i)
+                    is_variation.append(True)
+        self.strings = strings
+        self.owner = np.array(owner, dtype=np.int32)
+        self.is_variation = np.array(is_variation, dtype=bool)
+        # Prefilter columns
+        self.lengths = np.array([len(st) for st in strings], dtype=np.int32)
+        self.initials = np.array([_initials_bitmap(st) for st in strings], dtype=np.uint32)
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def match_with_top_n(
+        self,
+        raw_name: str,
+        threshold: float = DEFAULT_THRESHOLD,
+        n: int = 5,
+        min_score: float = 50.0,
+        prefilter: bool = False,
+        workers: int = 1,
+    ) -> Tuple[Optional[FuzzyMatchResult], List[Tuple[Dict, float]]]:
+        """
+        Best match above threshold, plus top-N entries above min_score.
+        workers is passed to rapidfuzz's cdist (-1 = all cores).
+        """
+        _check_rapidfuzz()
+
+        normalized_query = normalize_for_fuzzy(raw_name)
+        acronym = extract_acronym(raw_name)
+
+        strings, owner, is_variation = self.strings, self.owner, self.is_variation
+        # Acronym scoring compares against short strings — never prefilter it
+        if prefilter and not acronym and normalized_query:
+            query_len = len(normalized_query)
+            keep = np.flatnonzero(
+                (self.lengths >= 0.5 * query_len)
+                & (self.lengths <= 2 * query_len)
+                & ((self.initials & _initials_bitmap(normalized_query)) != 0)
+            )
+            strings = [strings[k] for k in keep]
+            owner, is_variation = owner[keep], is_variation[keep]
+
+        if not strings:
+            return None, []
+
+        combined = np.maximum(
+            rfprocess.cdist([normalized_query], strings, scorer=fuzz.token_sort_ratio,
+                            score_cutoff=0, workers=workers)[0],
+            rfprocess.cdist([normalized_query], strings, scorer=fuzz.WRatio,
+                            score_cutoff=0, workers=workers)[0],
+        )
+        scores_acro = None
+        if acronym:
+            scores_acro = rfprocess.cdist(
+                [acronym.lower().strip()], strings, scorer=fuzz.token_sort_ratio,
+                score_cutoff=0, workers=workers,
+            )[0]
+
+        # Best single string — first maximum, acronym only if strictly better
+        best_idx = int(np.argmax(combined))
+        best_score = float(combined[best_idx])
+        if best_score <= 0.0:
+            best_idx, best_score = -1, 0.0
+        if scores_acro is not None:
+            acro_idx = int(np.argmax(scores_acro))
+            if float(scores_acro[acro_idx]) > best_score:
+                best_idx, best_score = acro_idx, float(scores_acro[acro_idx])
+
+        best: Optional[FuzzyMatchResult] = None
+        if best_idx >= 0 and best_score >= threshold:
+            label = "variation" if is_variation[best_idx] else "canonical"
+            best = {
+                "raw_name": raw_name,
+                "matched_entry": self.entries[owner[best_idx]],
+                "score": round(best_score, 2),
+                "match_method": f"fuzzy_{label}",
+                "matched_string": strings[best_idx],
+            }
+
+        if n <= 0:
+            return best, []
+
+        # Top-N entries — max score per entry, ties keep entry order
+        per_string = combined if scores_acro is None else np.maximum(combined, scores_acro)
+        entry_best = np.full(len(self.entries), -np.inf, dtype=np.float64)
+        np.maximum.at(entry_best, owner, per_string)
+        keep = np.flatnonzero(entry_best >= min_score)
+        order = keep[np.argsort(-entry_best[keep], kind="stable")][:n]
+        return best, [(self.entries[i], float(entry_best[i])) for i in order]
 
 
 def fuzzy_match_typed(
@@ -221,68 +276,11 @@ def fuzzy_top_n(
 ) -> List[Tuple[Dict, float]]:
     """
     Return top-N candidate entries with scores above min_score.
-    Used by matcher.py to gather candidates for LLM disambiguation.
+    Candidates for LLM disambiguation (matcher.py uses FuzzyCandidateIndex).
 
     Returns: list of (entry, score) tuples, sorted by score descending.
     """
-    _check_rapidfuzz()
-
-    if not candidates:
-        return []
-
-    normalized_query = normalize_for_fuzzy(raw_name)
-    acronym = extract_acronym(raw_name)
-    candidate_strings = _build_candidate_strings(candidates)
-    if not candidate_strings:
-        return []
-
-    strings_only = [cs[0] for cs in candidate_strings]
-
-    scores_tsort = rfprocess.cdist(
-        [normalized_query], strings_only,
-        scorer=fuzz.token_sort_ratio,
-        score_cutoff=0,
-    )[0]
-    scores_wratio = rfprocess.cdist(
-        [normalized_query], strings_only,
-        scorer=fuzz.WRatio,
-        score_cutoff=0,
-    )[0]
-
-    # Per-string best score
-    per_string: List[Tuple[float, int]] = []
-    for i, (ts, wr) in enumerate(zip(scores_tsort, scores_wratio)):
-        per_string.append((max(float(ts), float(wr)), i))
-
-    if acronym:
-        acronym_norm = acronym.lower().strip()
-        scores_acro = rfprocess.cdist(
-            [acronym_norm], strings_only,
-            scorer=fuzz.token_sort_ratio,
-            score_cutoff=0,
-        )[0]
-        for i, score in enumerate(scores_acro):
-            cur_score, _ = per_string[i]
-            if float(score) > cur_score:
-                per_string[i] = (float(score), i)
-
-    # Deduplicate by entry — keep max score per entry
-    entry_best: Dict[int, float] = {}
-    for score, idx in per_string:
-        _, entry, _ = candidate_strings[idx]
-        eid = id(entry)  # use object id as key (entries are dicts in memory)
-        if eid not in entry_best or score > entry_best[eid]:
-            entry_best[eid] = score
-
-    # Map back to entry objects
-    id_to_entry: Dict[int, Dict] = {}
-    for _, entry, _ in candidate_strings:
-        id_to_entry[id(entry)] = entry
-
-    results = [
-        (id_to_entry[eid], score)
-        for eid, score in entry_best.items()
-        if score >= min_score
-    ]
-    results.sort(key=lambda x: x[1], reverse=True)
-    return results[:n]
+    _, top = FuzzyCandidateIndex(candidates).match_with_top_n(
+        raw_name, n=n, min_score=min_score
+    )
+    return top
@@ -18,7 +18,7 @@ TIMELINE_DATA_DIR = _PROJECT_ROOT / "services" / "WikiPrompt" / "llm_timeline_da
 sys.path.insert(0, str(_SERVICE_DIR))
 
 from matcher import OrgMatcher, MATCHING_CONFIG
-from ontology_db import OntologyDB
+from ontology_db import get_db
 
 
 def find_timeline_file(person_name: str) -> Path:
@@ -46,7 +46,7 @@ def main():
         config["use_llm_match"] = False
         config["use_llm_classify"] = False
 
-    db = OntologyDB()
+    db = get_db()
     matcher = OrgMatcher(config=config, db=db)
 
     file_path = find_timeline_file(args.person)
@@ -56,9 +56,9 @@ def main():
     person_name = data.get("person_name", args.person)
     results = matcher.match_person(person_name, data["career_events"])
 
-    matched = [r for r in results if r["matched"]]
-    review = [r for r in results if r.get("needs_review")]
-    unmatched = [r for r in results if not r["matched"] and not r.get("needs_review")]
+    matched = [r for r in results if r.matched]
+    review = [r for r in results if r.needs_review]
+    unmatched = [r for r in results if not r.matched and not r.needs_review]
 
     print(f"\n{'='*70}")
     print(f"  {person_name}  —  {len(results)} unique orgs")
@@ -68,22 +68,22 @@ def main():
     print(f"  {'Method':<22} {'Raw Name':<40} Canonical Match")
     print(f"  {'-'*22} {'-'*40} {'-'*30}")
     for r in matched:
-        print(f"  [{r['match_method']:<20}] {r['raw_name']:<40} {r['matched_canonical']}")
+        print(f"  [{r.match_method:<20}] {r.raw_name:<40} {r.matched_canonical}")
 
     print(f"\nNEEDS REVIEW ({len(review)})  — score in [70, 88%)")
     print(f"  {'Conf':>5}  {'Type':<20} {'Raw Name':<40} Proposed Match")
     print(f"  {'-----':>5}  {'-'*20} {'-'*40} {'-'*30}")
     for r in review:
-        conf = r.get("proposed_match_confidence") or 0
-        org_type = r.get("org_type_classified", "?")
-        proposed = r.get("proposed_match_canonical") or "(none)"
-        print(f"  {conf:>5.0%}  {org_type:<20} {r['raw_name']:<40} {proposed}")
+        conf = r.proposed_match_confidence or 0
+        org_type = r.org_type_classified
+        proposed = r.proposed_match_canonical or "(none)"
+        print(f"  {conf:>5.0%}  {org_type:<20} {r.raw_name:<40} {proposed}")
 
     print(f"\nUNMATCHED ({len(unmatched)})")
     print(f"  {'Type':<20} Raw Name")
     print(f"  {'-'*20} {'-'*40}")
     for r in unmatched:
-        print(f"  {r.get('org_type_classified','?'):<20} {r['raw_name']}")
+        print(f"  {r.org_type_classified:<20} {r.raw_name}")
 
     print()
 
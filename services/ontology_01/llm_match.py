@@ -9,20 +9,34 @@ Only called for genuinely ambiguous cases where:
 Also provides llm_classify_org() for cases where keyword classification fails.
 """
 
+import hashlib
 import json
 import os
 import re
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
+# orjson parses LLM responses faster; its JSONDecodeError subclasses json's
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load .env from project root
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_SERVICE_DIR = Path(__file__).resolve().parent
+_PROJECT_ROOT = _SERVICE_DIR.parent.parent
+_CACHE_FILE = _SERVICE_DIR / "llm_match_cache.sqlite"
 load_dotenv(_PROJECT_ROOT / ".env")
 
 LLM_MATCH_MODEL = "claude-sonnet-4-5-20250929"
 MAX_CANDIDATES = 5
+LLM_STREAM_TIMEOUT = 30.0  # seconds, wall-clock cap on a streamed disambiguation
 
 ORG_CATEGORIES = [
     "un_system",
@@ -35,13 +49,25 @@ ORG_CATEGORIES = [
 ]
 
 
+_ANTHROPIC = None  # anthropic module, imported on first use
+
+
+def _import_anthropic():
+    """Import anthropic once; raises ImportError if it is not installed."""
+    global _ANTHROPIC
+    if _ANTHROPIC is None:
+        import anthropic
+        _ANTHROPIC = anthropic
+    return _ANTHROPIC
+
+
 def is_available(api_key: Optional[str] = None) -> bool:
     """Return True if Anthropic API key is set and anthropic package is importable."""
     key = api_key or os.getenv("ANTHROPIC_API_KEY")
     if not key:
         return False
     try:
-        import anthropic  # noqa: F401
+        _import_anthropic()
         return True
     except ImportError:
         return False
@@ -56,7 +82,7 @@ def _get_client(api_key: Optional[str] = None):
             "Set it in your .env file or pass api_key explicitly."
         )
     try:
-        import anthropic
+        anthropic = _import_anthropic()
     except ImportError:
         raise ImportError(
             "anthropic package is required for LLM matching. "
@@ -65,15 +91,87 @@ def _get_client(api_key: Optional[str] = None):
     return anthropic.Anthropic(api_key=key)
 
 
+# Leading ```json / ``` and trailing ``` markdown fences
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+
+
 def _parse_json_response(text: str) -> Dict:
     """
     Strip markdown code fences and parse JSON from LLM response.
     Mirrors the pattern used in extract_timeline_with_llm.py.
     """
     # Remove ```json ... ``` or ``` ... ``` wrappers
-    text = re.sub(r"^```(?:json)?\s*", "", text.strip(), flags=re.IGNORECASE)
-    text = re.sub(r"\s*```$", "", text.strip())
-    return json.loads(text.strip())
+    return _json_loads(_FENCE_RE.sub("", text.strip()).strip())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _LLMCache:
+    """
+    Persistent store for LLM answers — one sqlite table of (key, value).
+    Keys are SHA-256 digests of the normalized request, values are JSON text.
+    Shared across matcher threads; cache failure is non-fatal (miss / no-op).
+    """
+
+    def __init__(self, path: Path = _CACHE_FILE):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache (key BLOB PRIMARY KEY, value BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached JSON text for key, or None on a miss."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT value FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, key: bytes, value) -> None:
+        """Store value (JSON-serializable) under key."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+                    (key, json.dumps(value)),
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+_cache = _LLMCache()
+
+
+def _cache_key(payload: Dict) -> bytes:
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).digest()
+
+
+def _disambiguation_cache_key(
+    raw_name: str,
+    candidates: List[Dict],
+    context: Optional[str],
+) -> bytes:
+    return _cache_key({
+        "n": raw_name.lower().strip(),
+        "c": sorted(e.get("canonical_name", "") for e in candidates),
+        "ctx": context,
+        "model": LLM_MATCH_MODEL,
+    })
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -131,11 +229,51 @@ def build_disambiguation_prompt(
     return "\n".join(lines)
 
 
+# Complete "best_match_index" / "confidence" fields in a partial response —
+# the lookahead makes sure a streamed number is not cut short ("0." of "0.85")
+_STREAM_BEST_IDX_RE = re.compile(r'"best_match_index"\s*:\s*(null|-?\d+)(?=\s*[,}])')
+_STREAM_CONFIDENCE_RE = re.compile(r'"confidence"\s*:\s*(-?[0-9.]+)(?=\s*[,}])')
+
+
+def _stream_disambiguation(client, prompt: str) -> Dict:
+    """
+    Stream a disambiguation answer and stop reading once best_match_index
+    and confidence are both complete — the trailing "reasoning" is never
+    needed. Falls back to parsing the full text if they never both appear.
+    Raises TimeoutError once LLM_STREAM_TIMEOUT has elapsed in total (the
+    client timeout alone only bounds each connect/read).
+    """
+    deadline = time.monotonic() + LLM_STREAM_TIMEOUT
+    buffer = ""
+    with client.messages.stream(
+        model=LLM_MATCH_MODEL,
+        max_tokens=500,
+        temperature=0.0,
+        messages=[{"role": "user", "content": prompt}],
+        timeout=LLM_STREAM_TIMEOUT,
+    ) as stream:
+        for text in stream.text_stream:
+            if time.monotonic() > deadline:
+                raise TimeoutError("streamed disambiguation exceeded LLM_STREAM_TIMEOUT")
+            buffer += text
+            idx_match = _STREAM_BEST_IDX_RE.search(buffer)
+            conf_match = idx_match and _STREAM_CONFIDENCE_RE.search(buffer)
+            if conf_match:
+                # Leaving the with-block closes the connection
+                idx = idx_match.group(1)
+                return {
+                    "best_match_index": None if idx == "null" else int(idx),
+                    "confidence": float(conf_match.group(1)),
+                }
+    return _parse_json_response(buffer)
+
+
 def llm_disambiguate(
     raw_name: str,
     candidates: List[Dict],
     api_key: Optional[str] = None,
     context: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Optional[Tuple[Dict, float]]:
     """
     Ask Claude to select the best ontology match for raw_name from candidates.
@@ -145,6 +283,7 @@ def llm_disambiguate(
         candidates: list of ontology entry dicts (up to MAX_CANDIDATES)
         api_key: Anthropic API key (loaded from .env if None)
         context: optional context about the person/career event
+        use_cache: reuse a previous answer for the same name/candidates/context
 
     Returns:
         (matched_entry, confidence_score) or None if no match found or on error
@@ -152,6 +291,19 @@ def llm_disambiguate(
     if not candidates:
         return None
 
+    # The cache stores the chosen canonical_name (not the entry), resolved
+    # against the current candidates so it survives ontology edits
+    key = _disambiguation_cache_key(raw_name, candidates, context)
+    if use_cache:
+        cached = _cache.get(key)
+        if cached is not None:
+            hit = json.loads(cached)
+            if hit.get("canonical_name") is None:
+                return None
+            for entry in candidates:
+                if entry.get("canonical_name") == hit["canonical_name"]:
+                    return (entry, float(hit["confidence"]))
+
     if not is_available(api_key):
         return None
 
@@ -159,29 +311,27 @@ def llm_disambiguate(
         client = _get_client(api_key)
         prompt = build_disambiguation_prompt(raw_name, candidates, context)
 
-        response = client.messages.create(
-            model=LLM_MATCH_MODEL,
-            max_tokens=500,
-            temperature=0.0,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        raw_text = response.content[0].text
-        result = _parse_json_response(raw_text)
+        result = _stream_disambiguation(client, prompt)
 
         best_idx = result.get("best_match_index")
         confidence = float(result.get("confidence", 0.0))
 
-        if best_idx is None or not isinstance(best_idx, int):
+        if (
+            best_idx is None
+            or not isinstance(best_idx, int)
+            or best_idx < 0
+            or best_idx >= len(candidates)
+            or confidence < 0.4  # below 40% confidence → treat as no match
+        ):
+            _cache.put(key, {"canonical_name": None})
             return None
 
-        if best_idx < 0 or best_idx >= len(candidates):
-            return None
-
-        if confidence < 0.4:  # below 40% confidence → treat as no match
-            return None
-
-        return (candidates[best_idx], confidence)
+        matched_entry = candidates[best_idx]
+        _cache.put(key, {
+            "canonical_name": matched_entry.get("canonical_name"),
+            "confidence": confidence,
+        })
+        return (matched_entry, confidence)
 
     except (json.JSONDecodeError, KeyError, IndexError, ValueError):
         # LLM returned unparseable output — treat as no match
@@ -191,6 +341,164 @@ def llm_disambiguate(
         return None
 
 
+def build_batch_disambiguation_prompt(
+    items: List[Tuple[str, List[Dict]]],
+    context: Optional[str] = None,
+) -> str:
+    """
+    Build one prompt that disambiguates several raw names at once.
+    Each raw name gets its own numbered candidate block.
+
+    Args:
+        items: list of (raw_name, candidates) pairs
+        context: optional context shared by all items (e.g., the person)
+    """
+    lines = [
+        "You are matching raw organization names to a curated ontology.",
+        "Each raw name below has its own list of candidate ontology entries.",
+    ]
+
+    if context:
+        lines.append(f"Context: {context}")
+
+    for i, (raw_name, candidates) in enumerate(items):
+        lines += [
+            "",
+            f'Raw organization name {i}: "{raw_name}"',
+            "Candidates (numbered from 0):",
+        ]
+        for j, entry in enumerate(candidates[:MAX_CANDIDATES]):
+            cname = entry.get("canonical_name", "")
+            meta = entry.get("meta_type", "")
+            sector = entry.get("sector", "")
+            variations = entry.get("variations_found", [])[:3]
+            var_str = ", ".join(f'"{v}"' for v in variations) if variations else "none"
+            lines.append(
+                f"  {j}. {cname} | type: {meta}/{sector} | aliases: {var_str}"
+            )
+
+    lines += [
+        "",
+        "Instructions:",
+        '- Return a JSON array only, one object per raw name: '
+        '[{"raw_name_index": <int>, "best_match_index": <int or null>, "confidence": <float 0-1>}, ...]',
+        "- best_match_index refers to that raw name's own candidate list.",
+        "- Set best_match_index to null if none of its candidates match.",
+        "- confidence: 1.0 = certain match, 0.5 = plausible, 0.0 = no match.",
+        "- Do not explain outside the JSON.",
+    ]
+
+    return "\n".join(lines)
+
+
+def llm_disambiguate_batch(
+    items: List[Tuple[str, List[Dict]]],
+    api_key: Optional[str] = None,
+    context: Optional[str] = None,
+    use_cache: bool = True,
+) -> List[Optional[Tuple[Dict, float]]]:
+    """
+    Disambiguate several (raw_name, candidates) pairs with a single Claude call.
+
+    Cached answers are reused per item (same cache as llm_disambiguate);
+    only the remaining items are sent. A single remaining item falls back
+    to llm_disambiguate.
+
+    Returns:
+        one (matched_entry, confidence) or None per input item, in order
+    """
+    results: List[Optional[Tuple[Dict, float]]] = [None] * len(items)
+    pending: List[int] = []
+
+    for i, (raw_name, candidates) in enumerate(items):
+        if not candidates:
+            continue
+        if use_cache:
+            cached = _cache.get(_disambiguation_cache_key(raw_name, candidates, context))
+            if cached is not None:
+                hit = json.loads(cached)
+                if hit.get("canonical_name") is None:
+                    continue
+                for entry in candidates:
+                    if entry.get("canonical_name") == hit["canonical_name"]:
+                        results[i] = (entry, float(hit["confidence"]))
+                        break
+                else:
+                    pending.append(i)
+                continue
+        pending.append(i)
+
+    if not pending or not is_available(api_key):
+        return results
+
+    if len(pending) == 1:
+        raw_name, candidates = items[pending[0]]
+        results[pending[0]] = llm_disambiguate(
+            raw_name, candidates, api_key=api_key, context=context,
+            use_cache=False,
+        )
+        return results
+
+    batch = [(items[i][0], items[i][1][:MAX_CANDIDATES]) for i in pending]
+
+    try:
+        client = _get_client(api_key)
+        prompt = build_batch_disambiguation_prompt(batch, context)
+
+        response = client.messages.create(
+            model=LLM_MATCH_MODEL,
+            max_tokens=100 + 60 * len(batch),
+            temperature=0.0,
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        raw_text = response.content[0].text
+        answers = _parse_json_response(raw_text)
+        if not isinstance(answers, list):
+            return results
+
+    except (json.JSONDecodeError, KeyError, IndexError, ValueError):
+        return results
+    except Exception:
+        return results
+
+    answered = set()
+    for answer in answers:
+        if not isinstance(answer, dict):
+            continue
+        k = answer.get("raw_name_index")
+        if not isinstance(k, int) or not 0 <= k < len(batch) or k in answered:
+            continue
+        answered.add(k)
+
+        raw_name, candidates = batch[k]
+        key = _disambiguation_cache_key(raw_name, items[pending[k]][1], context)
+        best_idx = answer.get("best_match_index")
+        try:
+            confidence = float(answer.get("confidence", 0.0))
+        except (TypeError, ValueError):
+            continue
+
+        if (
+            best_idx is None
+            or not isinstance(best_idx, int)
+            or best_idx < 0
+            or best_idx >= len(candidates)
+            or confidence < 0.4  # below 40% confidence → treat as no match
+        ):
+            _cache.put(key, {"canonical_name": None})
+            continue
+
+        matched_entry = candidates[best_idx]
+        _cache.put(key, {
+            "canonical_name": matched_entry.get("canonical_name"),
+            "confidence": confidence,
+        })
+        results[pending[k]] = (matched_entry, confidence)
+
+    return results
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Organization type classification via LLM
 # ─────────────────────────────────────────────────────────────────────────────
@@ -198,6 +506,7 @@ def llm_disambiguate(
 def llm_classify_org(
     raw_name: str,
     api_key: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Optional[str]:
     """
     Ask Claude to classify an org name into one of the seven categories.
@@ -206,6 +515,12 @@ def llm_classify_org(
 
     Returns one of the seven category strings, or None on failure.
     """
+    key = _cache_key({"classify": raw_name.lower().strip(), "model": LLM_MATCH_MODEL})
+    if use_cache:
+        cached = _cache.get(key)
+        if cached is not None:
+            return json.loads(cached)
+
     if not is_available(api_key):
         return None
 
@@ -238,10 +553,11 @@ def llm_classify_org(
         result = _parse_json_response(raw_text)
 
         category = result.get("category", "").strip().lower()
-        if category in ORG_CATEGORIES:
-            return category
+        if category not in ORG_CATEGORIES:
+            category = None
 
-        return None
+        _cache.put(key, category)
+        return category
 
     except Exception:
         return None
@@ -5,29 +5,51 @@ Processes a single org name string through:
   1. Keyword-based classification (classifiers.py)
   2. Exact match on canonical_name and variations_found (ontology_db.py)
   3. Fuzzy match via rapidfuzz (fuzzy_match.py)
-  4. Semantic embedding match via Cohere (embedding_match.py)
+  4. Semantic embedding match via Cohere (embedding_match.py),
+     or agreement between the fuzzy and embedding top candidates
   5. LLM disambiguation via Claude (llm_match.py)
   6. Review queue for medium-confidence matches
   7. Unmatched / stub creation
 """
 
+import atexit
+import functools
+import hashlib
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from classifiers import (
     classify_org,
+    CLASSIFIER_FINGERPRINT,
     CATEGORY_TO_META_TYPE,
     CATEGORY_TO_SEARCH_META_TYPE,
 )
-from ontology_db import OntologyDB
-from fuzzy_match import (
-    fuzzy_match_typed,
-    fuzzy_match_all,
-    fuzzy_top_n,
-    FuzzyMatchResult,
-)
+from ontology_db import OntologyDB, get_db
+from fuzzy_match import FuzzyCandidateIndex, FuzzyMatchResult
 from embedding_match import EmbeddingMatcher
-from llm_match import llm_disambiguate, llm_classify_org, is_available as llm_available
+from llm_match import (
+    llm_disambiguate,
+    llm_disambiguate_batch,
+    llm_classify_org,
+    is_available as llm_available,
+)
+
+_SERVICE_DIR = Path(__file__).resolve().parent
+_SEMANTIC_CACHE_BASE = _SERVICE_DIR / "llm_semantic_cache"
+_EMBED_INDEX_CACHE = _SERVICE_DIR / "embedding_index_cache.npz"
+_RESULT_CACHE_FILE = _SERVICE_DIR / "match_results_cache.sqlite"
+
+DETERMINISTIC_CACHE_SIZE = 50000  # memoized pre-LLM outcomes per OrgMatcher
+
+# Search meta_type → compact code for columnar per-entry arrays
+_MT_CODE: Dict[str, int] = {"io": 0, "gov": 1, "university": 2}
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -42,28 +64,64 @@ MATCHING_CONFIG = {
     "use_llm_classify": True,       # set False to disable LLM org classification
     "max_llm_candidates": 5,        # max candidates passed to LLM
     "deduplicate_orgs": True,       # deduplicate org names within a person
+    "use_semantic_llm_cache": True, # reuse LLM answers for near-paraphrase names
+    "match_workers": 8,             # threads per person for API-bound stages
+    "fuzzy_prefilter": False,       # skip length/initial-mismatched strings (lossy)
+    "fuzzy_workers": 1,             # rapidfuzz cdist threads (-1 = all cores)
+    "use_fuzzy_embed_agreement": True,  # skip the LLM when fuzzy + embedding top-1 agree
+    "persist_match_results": True,  # reuse pre-LLM final results across runs
 }
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Result type
 # ─────────────────────────────────────────────────────────────────────────────
 
-# MatchResult is a plain dict with these keys:
-#   raw_name: str
-#   matched_canonical: Optional[str]
-#   match_method: Optional[str]  — "exact_canonical"|"exact_variation"|
-#                                  "fuzzy_canonical"|"fuzzy_variation"|
-#                                  "embedding"|"llm"|None
-#   match_confidence: Optional[float]  — 0.0-1.0
-#   ontology_tag: Optional[str]        — canonical_tag from un/gov_ontology
-#   meta_type: Optional[str]           — from matched entry or classifier
-#   matched: bool
-#   needs_review: bool                 — True if medium-confidence fuzzy match
-#   org_type_classified: str           — output of classify_org()
-#   proposed_match_canonical: Optional[str]  — for needs_review=True cases
-#   proposed_match_confidence: Optional[float]
+@dataclass(slots=True)
+class MatchResult:
+    """
+    Outcome of matching one raw org name. Use as_dict() for JSON output.
+
+    match_method: "exact_canonical"|"exact_variation"|"fuzzy_canonical"|
+                  "fuzzy_variation"|"embedding"|"fuzzy_embed_agree"|"llm"|None
+    match_confidence: 0.0-1.0
+    ontology_tag: canonical_tag from un/gov_ontology
+    meta_type: from matched entry or classifier
+    needs_review: True if medium-confidence fuzzy match
+    org_type_classified: output of classify_org()
+    proposed_match_*: for needs_review=True cases
+    """
+    raw_name: str
+    matched_canonical: Optional[str] = None
+    match_method: Optional[str] = None
+    match_confidence: Optional[float] = None
+    ontology_tag: Optional[str] = None
+    meta_type: Optional[str] = None
+    matched: bool = False
+    needs_review: bool = False
+    org_type_classified: str = "other"
+    proposed_match_canonical: Optional[str] = None
+    proposed_match_confidence: Optional[float] = None
+
+    def as_dict(self) -> Dict:
+        """Plain dict with the fields in declaration order."""
+        return {name: getattr(self, name) for name in _MATCH_RESULT_FIELDS}
+
+
+_MATCH_RESULT_FIELDS = tuple(f.name for f in fields(MatchResult))
+
+
+def _norm_org_key(name: str) -> str:
+    """Dedup key for org names: case-insensitive, whitespace-collapsed."""
+    return " ".join(name.split()).lower()
+
 
-MatchResult = Dict
+class _PendingLLM(NamedTuple):
+    """A match_single run stopped just before Step 5's Claude call."""
+    raw_name: str
+    org_type: str
+    candidates: List[Dict]                     # for LLM disambiguation
+    fuzzy_candidate: Optional[FuzzyMatchResult]  # Step 6 fallback
+    query_vec: Optional[np.ndarray] = None     # raw_name embedding, if computed
 
 
 def _get_ontology_tag(entry: Dict) -> Optional[str]:
@@ -87,34 +145,214 @@ def _build_result(
     needs_review: bool = False,
     proposed_entry: Optional[Dict] = None,
     proposed_confidence: Optional[float] = None,
+    ontology_tag: Optional[str] = None,
 ) -> MatchResult:
-    """Build a standardized MatchResult dict."""
-    result: MatchResult = {
-        "raw_name": raw_name,
-        "matched_canonical": None,
-        "match_method": method,
-        "match_confidence": confidence,
-        "ontology_tag": None,
-        "meta_type": CATEGORY_TO_META_TYPE.get(org_type, "other"),
-        "matched": matched,
-        "needs_review": needs_review,
-        "org_type_classified": org_type,
-        "proposed_match_canonical": None,
-        "proposed_match_confidence": None,
-    }
+    """
+    Build a standardized MatchResult.
+    ontology_tag is the matched entry's tag (see OrgMatcher._ontology_tag).
+    """
+    meta_type = CATEGORY_TO_META_TYPE.get(org_type, "other")
+    matched_canonical = None
+    proposed_canonical = None
 
     if matched and matched_entry:
-        result["matched_canonical"] = matched_entry.get("canonical_name")
-        result["ontology_tag"] = _get_ontology_tag(matched_entry)
-        result["meta_type"] = matched_entry.get("meta_type", result["meta_type"])
+        matched_canonical = matched_entry.get("canonical_name")
+        meta_type = matched_entry.get("meta_type", meta_type)
+    else:
+        ontology_tag = None
 
     if needs_review and proposed_entry:
-        result["proposed_match_canonical"] = proposed_entry.get("canonical_name")
-        result["proposed_match_confidence"] = proposed_confidence
+        proposed_canonical = proposed_entry.get("canonical_name")
         # Also set meta_type from proposed entry for context
-        result["meta_type"] = proposed_entry.get("meta_type", result["meta_type"])
+        meta_type = proposed_entry.get("meta_type", meta_type)
+    else:
+        proposed_confidence = None
+
+    return MatchResult(
+        raw_name=raw_name,
+        matched_canonical=matched_canonical,
+        match_method=method,
+        match_confidence=confidence,
+        ontology_tag=ontology_tag,
+        meta_type=meta_type,
+        matched=matched,
+        needs_review=needs_review,
+        org_type_classified=org_type,
+        proposed_match_canonical=proposed_canonical,
+        proposed_match_confidence=proposed_confidence,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Semantic LLM cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _SemanticLLMCache:
+    """
+    Reuses an earlier LLM disambiguation for near-paraphrase raw names
+    ("UNDP" / "U.N. Development Programme") instead of asking Claude again.
 
-    return result
+    A hit requires all of:
+      - cosine similarity >= min_similarity against a past query embedding
+      - Jaccard overlap >= min_overlap between the two candidate sets
+      - the past answer being among the current candidates
+
+    Persisted as <base>.npy (unit query vectors) + <base>.json (records).
+    """
+
+    def __init__(
+        self,
+        base_path: Path = _SEMANTIC_CACHE_BASE,
+        min_similarity: float = 0.95,
+        min_overlap: float = 0.8,
+    ):
+        self._vectors_path = base_path.with_suffix(".npy")
+        self._records_path = base_path.with_suffix(".json")
+        self._min_similarity = min_similarity
+        self._min_overlap = min_overlap
+        self._lock = threading.Lock()
+        self._vectors: List[np.ndarray] = []
+        # (candidate canonical_names, matched canonical_name, confidence)
+        self._records: List[Tuple[frozenset, str, float]] = []
+        self._matrix: Optional[np.ndarray] = None  # stacked self._vectors
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if not (self._vectors_path.exists() and self._records_path.exists()):
+            return
+        try:
+            vectors = np.load(self._vectors_path)
+            with open(self._records_path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError):
+            return  # cache failure is non-fatal
+        if len(vectors) != len(records):
+            return
+        self._vectors = list(vectors)
+        self._records = [(frozenset(c), m, float(conf)) for c, m, conf in records]
+
+    def save(self) -> None:
+        """Write the cache to disk if anything was added since the last save."""
+        with self._lock:
+            if not self._dirty or not self._vectors:
+                return
+            try:
+                np.save(self._vectors_path, np.stack(self._vectors))
+                with open(self._records_path, "w", encoding="utf-8") as f:
+                    json.dump(
+                        [[sorted(c), m, conf] for c, m, conf in self._records],
+                        f, ensure_ascii=False,
+                    )
+                self._dirty = False
+            except OSError:
+                pass
+
+    @staticmethod
+    def _unit(vec: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vec)
+        return (vec / norm if norm else vec).astype(np.float32)
+
+    def lookup(
+        self,
+        query_vec: np.ndarray,
+        candidates: List[Dict],
+    ) -> Optional[Tuple[Dict, float]]:
+        """Return (entry, confidence) from a near-identical past query, or None."""
+        with self._lock:
+            if not self._vectors:
+                return None
+            if self._matrix is None:
+                self._matrix = np.stack(self._vectors)
+            sims = self._matrix @ self._unit(query_vec)
+            best = int(np.argmax(sims))
+            if float(sims[best]) < self._min_similarity:
+                return None
+            past_candidates, matched_canonical, confidence = self._records[best]
+
+        current = {e.get("canonical_name") for e in candidates}
+        overlap = len(current & past_candidates) / max(len(current | past_candidates), 1)
+        if overlap < self._min_overlap:
+            return None
+        for entry in candidates:
+            if entry.get("canonical_name") == matched_canonical:
+                return (entry, confidence)
+        return None
+
+    def add(
+        self,
+        query_vec: np.ndarray,
+        candidates: List[Dict],
+        matched_entry: Dict,
+        confidence: float,
+    ) -> None:
+        """Record a fresh LLM answer for future lookups."""
+        with self._lock:
+            self._vectors.append(self._unit(query_vec))
+            self._records.append((
+                frozenset(e.get("canonical_name") for e in candidates),
+                matched_entry.get("canonical_name"),
+                confidence,
+            ))
+            self._matrix = None
+            self._dirty = True
+
+
+class _MatchResultStore:
+    """
+    On-disk write-through cache of final MatchResults from the context-free
+    stages (Steps 1-4). Rows are keyed by (version, raw_name); the version
+    hashes the ontology entries and everything else that shapes those stages,
+    so a changed ontology or config simply misses. Cache failure is non-fatal.
+    """
+
+    def __init__(self, path: Path = _RESULT_CACHE_FILE):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self._path), check_same_thread=False, isolation_level=None
+            )
+            # WAL + NORMAL: each autocommitted insert skips the fsync
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS match_results "
+                "(version TEXT, raw_name TEXT, result_json TEXT, "
+                "PRIMARY KEY (version, raw_name))"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, version: str, raw_name: str) -> Optional[MatchResult]:
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT result_json FROM match_results WHERE version = ? AND raw_name = ?",
+                    (version, raw_name),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        try:
+            return MatchResult(**json.loads(row[0]))
+        except (ValueError, TypeError):
+            return None
+
+    def put(self, version: str, result: MatchResult) -> None:
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO match_results (version, raw_name, result_json) "
+                    "VALUES (?, ?, ?)",
+                    (version, result.raw_name, json.dumps(result.as_dict(), ensure_ascii=False)),
+                )
+        except sqlite3.Error:
+            pass
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -127,6 +365,9 @@ class OrgMatcher:
 
     Initialize once and reuse across many org names for efficiency
     (avoids reloading the ontology and rebuilding indexes on every call).
+    Indexes, memoized results and the result-store version are built from
+    the ontology as it stood at construction; create a new OrgMatcher
+    after the ontology changes.
     """
 
     def __init__(
@@ -135,7 +376,7 @@ class OrgMatcher:
         db: Optional[OntologyDB] = None,
     ):
         self.config = config or MATCHING_CONFIG
-        self.db = db or OntologyDB()
+        self.db = db or get_db()
         self._embedder: Optional[EmbeddingMatcher] = None
 
         if self.config.get("use_embedding", True):
@@ -149,26 +390,125 @@ class OrgMatcher:
             "gov": self.db.get_by_meta_type("gov"),
             "university": self.db.get_by_meta_type("university"),
         }
-        self._all_entries: List[Dict] = self.db.get_all()
+        self._all_entries: Sequence[Dict] = self.db.get_all()
 
-        # Track embedding indexes built to avoid rebuilding
-        self._embed_indexed_type: Optional[str] = None
+        # Tags are static after load — resolve them once, not per match.
+        # Kept beside the entries (keyed by id) because entries get persisted.
+        self._entry_tags: Dict[int, Tuple[Dict, Optional[str]]] = {
+            id(e): (e, _get_ontology_tag(e)) for e in self._all_entries
+        }
+
+        # Columnar meta_type codes over _all_entries (-1 = not a search type)
+        self._entry_mt_code = np.array(
+            [_MT_CODE.get(e.get("meta_type", ""), -1) for e in self._all_entries],
+            dtype=np.int8,
+        )
+
+        # Normalized fuzzy candidate strings per search domain, built once
+        self._fuzzy_indexes: Dict[str, FuzzyCandidateIndex] = {
+            meta_type: FuzzyCandidateIndex(entries)
+            for meta_type, entries in self._typed_entries.items()
+        }
 
-    def _get_entries_for_type(self, search_meta_type: Optional[str]) -> List[Dict]:
+        # LLM availability (API key + package) is fixed for the process
+        self._llm_ok = llm_available()
+        self._llm_classify_ok = self._llm_ok and bool(self.config.get("use_llm_classify"))
+        self._llm_match_ok = self._llm_ok and bool(self.config.get("use_llm_match"))
+
+        # One embedding index over the whole ontology, built once. Searches
+        # for a meta_type apply a boolean mask instead of rebuilding.
+        self._meta_type_masks: Dict[str, np.ndarray] = {}
+        if self._embedder is not None:
+            self._embedder.build_ontology_index(
+                self._all_entries, cache_path=_EMBED_INDEX_CACHE
+            )
+            self._meta_type_masks = {
+                meta_type: self._entry_mt_code == _MT_CODE[meta_type]
+                for meta_type in self._typed_entries
+            }
+
+        # Semantic cache in front of LLM disambiguation (needs query embeddings)
+        self._semantic_cache: Optional[_SemanticLLMCache] = None
+        if self._embedder is not None and self.config.get("use_semantic_llm_cache", True):
+            self._semantic_cache = _SemanticLLMCache()
+            atexit.register(self._semantic_cache.save)
+
+        # Final results of those stages also persist across runs
+        self._result_store: Optional[_MatchResultStore] = None
+        self._result_version = ""
+        if self.config.get("persist_match_results", True):
+            self._result_store = _MatchResultStore()
+            self._result_version = self._compute_result_version()
+
+        # Memoized Steps 1-4 + candidate gathering. These don't depend on the
+        # LLM context, so repeated orgs (within and across persons) skip them.
+        self._match_deterministic = functools.lru_cache(maxsize=DETERMINISTIC_CACHE_SIZE)(
+            self._match_pre_llm_persistent
+        )
+
+    def _compute_result_version(self) -> str:
+        """Hash of the ontology entries + config + classifier rules + backends."""
+        payload = json.dumps(
+            {
+                "entries": self._all_entries,
+                "config": self.config,
+                "classifier": CLASSIFIER_FINGERPRINT,
+                "embedding": self._embedder is not None,
+                "llm": self._llm_ok,
+            },
+            sort_keys=True, ensure_ascii=False, default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _match_pre_llm_persistent(self, raw_name: str) -> Union[MatchResult, _PendingLLM]:
+        """
+        _match_single_pre_llm, reading/writing final results on disk.
+        Results that rest on a failed LLM classification are not written,
+        so a transient API error doesn't outlive the run.
+        """
+        if self._result_store is None:
+            return self._match_single_pre_llm(raw_name)
+        cached = self._result_store.get(self._result_version, raw_name)
+        if cached is not None:
+            return cached
+        outcome, definite = self._match_pre_llm_steps(raw_name)
+        if definite and isinstance(outcome, MatchResult):
+            self._result_store.put(self._result_version, outcome)
+        return outcome
+
+    def _match_cached(self, raw_name: str) -> Union[MatchResult, _PendingLLM]:
+        """_match_single_pre_llm through the memo; final results are copied."""
+        outcome = self._match_deterministic(raw_name.strip())
+        if isinstance(outcome, _PendingLLM):
+            return outcome
+        return replace(outcome)
+
+    def _ontology_tag(self, entry: Dict) -> Optional[str]:
+        """canonical_tag of an ontology entry, precomputed for known entries."""
+        known = self._entry_tags.get(id(entry))
+        if known is not None and known[0] is entry:
+            return known[1]
+        return _get_ontology_tag(entry)
+
+    def _get_entries_for_type(self, search_meta_type: Optional[str]) -> Sequence[Dict]:
         """Return the appropriate entry list for a search domain."""
         if search_meta_type is None:
             return self._all_entries
         return self._typed_entries.get(search_meta_type, self._all_entries)
 
-    def _ensure_embed_index(self, search_meta_type: Optional[str]) -> None:
-        """Build (or rebuild if needed) the embedding index for the given domain."""
-        if self._embedder is None:
-            return
-        key = search_meta_type or "all"
-        if self._embed_indexed_type != key:
-            entries = self._get_entries_for_type(search_meta_type)
-            self._embedder.build_ontology_index(entries)
-            self._embed_indexed_type = key
+    def _get_fuzzy_index_for_type(self, search_meta_type: Optional[str]) -> FuzzyCandidateIndex:
+        """Prebuilt FuzzyCandidateIndex for a search domain (all entries if untyped)."""
+        index = self._fuzzy_indexes.get(search_meta_type or "")
+        if index is None:
+            index = FuzzyCandidateIndex(self._get_entries_for_type(search_meta_type))
+            self._fuzzy_indexes[search_meta_type or ""] = index
+        return index
+
+    def _embed_mask_for_type(self, search_meta_type: Optional[str]) -> Optional[np.ndarray]:
+        """Embedding-index mask matching _get_entries_for_type (None = all entries)."""
+        if search_meta_type is None:
+            return None
+        return self._meta_type_masks.get(search_meta_type)
 
     def match_single(
         self,
@@ -184,11 +524,34 @@ class OrgMatcher:
                      (e.g., "Person: Amina Mohammed, role: Architect")
 
         Returns:
-            MatchResult dict
+            MatchResult
+        """
+        outcome = self._match_cached(raw_name)
+        if isinstance(outcome, _PendingLLM):
+            return self._finalize_with_llm([outcome], context=context)[0]
+        return outcome
+
+    def _match_single_pre_llm(self, raw_name: str) -> Union[MatchResult, _PendingLLM]:
+        """
+        Steps 1-4 plus Step 5's candidate gathering.
+
+        Returns a final MatchResult, or a _PendingLLM when only the Claude
+        call remains — so match_person can disambiguate all of a person's
+        orgs in one request.
+        """
+        return self._match_pre_llm_steps(raw_name)[0]
+
+    def _match_pre_llm_steps(
+        self, raw_name: str,
+    ) -> Tuple[Union[MatchResult, _PendingLLM], bool]:
+        """
+        _match_single_pre_llm, plus whether the outcome is definite: False
+        when LLM classification was attempted and failed, leaving the keyword
+        fallback in place of an answer.
         """
         raw_name = raw_name.strip()
         if not raw_name:
-            return _build_result("", "other", matched=False)
+            return _build_result("", "other", matched=False), True
 
         cfg = self.config
         accept_thresh = cfg["fuzzy_threshold_accept"]
@@ -196,36 +559,30 @@ class OrgMatcher:
 
         # ── Step 1: Classify ─────────────────────────────────────────────────
         org_type = classify_org(raw_name)
+        definite = True
 
         # If keyword classification yields "other" AND LLM classify is on,
         # try LLM classification as a hint (but don't block on it)
-        if org_type == "other" and cfg.get("use_llm_classify") and llm_available():
+        if org_type == "other" and self._llm_classify_ok:
             llm_type = llm_classify_org(raw_name)
-            if llm_type and llm_type != "other":
+            if llm_type is None:
+                definite = False
+            elif llm_type != "other":
                 org_type = llm_type
 
         search_meta_type = CATEGORY_TO_SEARCH_META_TYPE.get(org_type)
 
         # ── Step 2: Exact matching ────────────────────────────────────────────
-        entry = self.db.lookup_canonical(raw_name)
-        if entry:
-            return _build_result(
-                raw_name, org_type,
-                matched_entry=entry,
-                method="exact_canonical",
-                confidence=1.0,
-                matched=True,
-            )
-
-        entry = self.db.lookup_variation(raw_name)
+        entry, field = self.db.lookup_exact(raw_name)
         if entry:
             return _build_result(
                 raw_name, org_type,
                 matched_entry=entry,
-                method="exact_variation",
+                ontology_tag=self._ontology_tag(entry),
+                method=f"exact_{field}",  # "exact_canonical" or "exact_variation"
                 confidence=1.0,
                 matched=True,
-            )
+            ), definite
 
         # ── Step 3: Fuzzy matching ────────────────────────────────────────────
         # Skip fuzzy entirely for types with no ontology coverage.
@@ -233,17 +590,23 @@ class OrgMatcher:
         # these orgs simply aren't in the ontology and should go straight to stub.
         UNCOVERED_TYPES = {"ngo", "private", "other"}
         if org_type in UNCOVERED_TYPES:
-            return _build_result(raw_name, org_type, matched=False)
+            return _build_result(raw_name, org_type, matched=False), definite
 
         fuzzy_candidate: Optional[FuzzyMatchResult] = None
-
-        if search_meta_type:
-            fuzzy_result = fuzzy_match_typed(
-                raw_name, self.db, search_meta_type,
-                threshold=review_thresh,
-            )
-        else:
-            fuzzy_result = None
+        max_candidates = cfg["max_llm_candidates"]
+        want_llm = self._llm_match_ok
+
+        # One scoring pass yields both the Step 3 best match and the Step 5
+        # fuzzy candidates (only gathered when the LLM stage can run)
+        fuzzy_index = self._get_fuzzy_index_for_type(search_meta_type)
+        fuzzy_result, fuzzy_top = fuzzy_index.match_with_top_n(
+            raw_name,
+            threshold=review_thresh,
+            n=max_candidates if want_llm else 0,
+            min_score=40.0,
+            prefilter=bool(cfg.get("fuzzy_prefilter")),
+            workers=cfg.get("fuzzy_workers", 1),
+        )
 
         if fuzzy_result:
             score = fuzzy_result["score"]
@@ -251,72 +614,156 @@ class OrgMatcher:
                 return _build_result(
                     raw_name, org_type,
                     matched_entry=fuzzy_result["matched_entry"],
+                    ontology_tag=self._ontology_tag(fuzzy_result["matched_entry"]),
                     method=fuzzy_result["match_method"],
                     confidence=round(score / 100.0, 4),
                     matched=True,
-                )
+                ), definite
             else:
                 # Score in review band — store as candidate, continue to embedding/LLM
                 fuzzy_candidate = fuzzy_result
 
         # ── Step 4: Embedding matching ────────────────────────────────────────
-        embed_result: Optional[Tuple[Dict, float]] = None
+        # A single top-N search: its head decides Step 4, the rest feeds Step 5
+        embed_top: List[Tuple[Dict, float]] = []
+        query_vec: Optional[np.ndarray] = None
 
         if self._embedder and cfg.get("use_embedding"):
-            self._ensure_embed_index(search_meta_type)
-            embed_result = self._embedder.find_similar(
-                raw_name,
-                threshold=cfg["embedding_threshold"],
+            query_vec = self._embedder.embed_query(raw_name)
+            embed_top = self._embedder.find_top_n_vec(
+                query_vec,
+                n=max(max_candidates, 1),
+                min_score=-1.0,
+                mask=self._embed_mask_for_type(search_meta_type),
             )
 
-            if embed_result:
-                entry, score = embed_result
+            if embed_top and embed_top[0][1] >= cfg["embedding_threshold"]:
+                entry, score = embed_top[0]
                 return _build_result(
                     raw_name, org_type,
                     matched_entry=entry,
+                    ontology_tag=self._ontology_tag(entry),
                     method="embedding",
                     confidence=round(score, 4),
                     matched=True,
-                )
+                ), definite
+
+            # Review-band fuzzy match and the embedding's best guess name the
+            # same entry: two independent signals agree, so skip the LLM.
+            # Without an LLM stage this would replace human review, so the
+            # match stays needs_review (Step 6) instead.
+            if (
+                want_llm
+                and cfg.get("use_fuzzy_embed_agreement", True)
+                and fuzzy_candidate
+                and embed_top
+                and embed_top[0][1] >= 0.50
+                and embed_top[0][0].get("canonical_name")
+                == fuzzy_candidate["matched_entry"].get("canonical_name")
+            ):
+                entry, score = embed_top[0]
+                return _build_result(
+                    raw_name, org_type,
+                    matched_entry=entry,
+                    ontology_tag=self._ontology_tag(entry),
+                    method="fuzzy_embed_agree",
+                    confidence=round((fuzzy_candidate["score"] / 100.0 + score) / 2, 4),
+                    matched=True,
+                ), definite
 
-        # ── Step 5: LLM disambiguation ────────────────────────────────────────
-        if cfg.get("use_llm_match") and llm_available():
+        # ── Step 5: LLM disambiguation (candidates; the call is deferred) ────
+        candidates_only: List[Dict] = []
+        if want_llm:
             # Gather top-N candidates from fuzzy + embedding
-            entries_for_search = self._get_entries_for_type(search_meta_type)
-            top_candidates = fuzzy_top_n(
-                raw_name, entries_for_search,
-                n=cfg["max_llm_candidates"],
-                min_score=40.0,
-            )
+            top_candidates = list(fuzzy_top)
+
+            # Merge: add embed results not already in top_candidates
+            existing_names = {e.get("canonical_name") for e, _ in top_candidates}
+            for e, s in embed_top:
+                if s >= 0.50 and e.get("canonical_name") not in existing_names:
+                    top_candidates.append((e, s))
+
+            candidates_only = [e for e, _ in top_candidates[:max_candidates]]
+
+        pending = _PendingLLM(
+            raw_name, org_type, candidates_only, fuzzy_candidate, query_vec
+        )
+        if not candidates_only:
+            return self._resolve_pending(pending, None), definite
+        return pending, definite
+
+    def _finalize_with_llm(
+        self,
+        pending_batch: List[_PendingLLM],
+        context: Optional[str] = None,
+    ) -> List[MatchResult]:
+        """
+        Run Step 5's Claude call for every pending org, then Steps 6-7.
 
-            # Add embedding top-N if available
-            if self._embedder and cfg.get("use_embedding"):
-                self._ensure_embed_index(search_meta_type)
-                embed_top = self._embedder.find_top_n(
-                    raw_name, n=cfg["max_llm_candidates"], min_score=0.50
+        Semantic-cache hits are resolved locally; the rest go out as one
+        llm_disambiguate call (single org) or one batched request.
+        """
+        llm_results: List[Optional[Tuple[Dict, float]]] = [None] * len(pending_batch)
+        query_vecs: List[Optional[np.ndarray]] = [None] * len(pending_batch)
+        misses: List[int] = []
+
+        for i, pending in enumerate(pending_batch):
+            if self._semantic_cache is not None:
+                query_vecs[i] = pending.query_vec
+                if query_vecs[i] is None:
+                    query_vecs[i] = self._embedder.embed_query(pending.raw_name)
+                llm_results[i] = self._semantic_cache.lookup(
+                    query_vecs[i], pending.candidates
                 )
-                # Merge: add embed results not already in top_candidates
-                existing_names = {e.get("canonical_name") for e, _ in top_candidates}
-                for e, s in embed_top:
-                    if e.get("canonical_name") not in existing_names:
-                        top_candidates.append((e, s))
-
-            if top_candidates:
-                candidates_only = [e for e, _ in top_candidates[:cfg["max_llm_candidates"]]]
-                llm_result = llm_disambiguate(
-                    raw_name, candidates_only, context=context
+            if llm_results[i] is None:
+                misses.append(i)
+
+        if len(misses) == 1:
+            pending = pending_batch[misses[0]]
+            answers = [llm_disambiguate(
+                pending.raw_name, pending.candidates, context=context
+            )]
+        elif misses:
+            answers = llm_disambiguate_batch(
+                [(pending_batch[i].raw_name, pending_batch[i].candidates) for i in misses],
+                context=context,
+            )
+        else:
+            answers = []
+
+        for i, answer in zip(misses, answers):
+            llm_results[i] = answer
+            if answer and query_vecs[i] is not None:
+                self._semantic_cache.add(
+                    query_vecs[i], pending_batch[i].candidates, *answer
                 )
-                if llm_result:
-                    entry, confidence = llm_result
-                    return _build_result(
-                        raw_name, org_type,
-                        matched_entry=entry,
-                        method="llm",
-                        confidence=round(confidence, 4),
-                        matched=True,
-                    )
+
+        return [
+            self._resolve_pending(pending, llm_result)
+            for pending, llm_result in zip(pending_batch, llm_results)
+        ]
+
+    def _resolve_pending(
+        self,
+        pending: _PendingLLM,
+        llm_result: Optional[Tuple[Dict, float]],
+    ) -> MatchResult:
+        """Turn the LLM answer (or its absence) into the final MatchResult."""
+        raw_name, org_type = pending.raw_name, pending.org_type
+
+        if llm_result:
+            entry, confidence = llm_result
+            return _build_result(
+                raw_name, org_type,
+                matched_entry=entry,
+                ontology_tag=self._ontology_tag(entry),
+                method="llm",
+                confidence=round(confidence, 4),
+                matched=True,
+            )
 
         # ── Step 6: Review queue (medium-confidence fuzzy candidate) ──────────
+        fuzzy_candidate = pending.fuzzy_candidate
         if fuzzy_candidate:
             return _build_result(
                 raw_name, org_type,
@@ -337,7 +784,8 @@ class OrgMatcher:
         """
         Match all unique organizations from a person's career events.
 
-        Deduplicates org names before matching — each unique org is matched once.
+        Deduplicates org names before matching — each unique org is matched once,
+        and case/whitespace variants of a name share a single pipeline run.
         Returns one MatchResult per unique org name (not per event occurrence).
 
         Args:
@@ -345,7 +793,7 @@ class OrgMatcher:
             career_events: list of career event dicts (each has 'organizations' list)
 
         Returns:
-            List of MatchResult dicts, one per unique org string
+            List of MatchResult, one per unique org string
         """
         # Collect all org names, deduplicate preserving first-occurrence order
         seen = set()
@@ -366,10 +814,42 @@ class OrgMatcher:
                     if org:
                         org_names.append(org)
 
-        results = []
+        # Case/whitespace variants ("UN Women", "un  women") run the pipeline
+        # once; the result is re-broadcast to each variant afterwards
+        representatives: Dict[str, str] = {}
         for org in org_names:
-            context = f"Person: {person_name}"
-            result = self.match_single(org, context=context)
-            results.append(result)
+            representatives.setdefault(_norm_org_key(org), org)
+        unique_orgs = list(representatives.values())
+
+        # Run everything up to the Claude call (concurrently — those stages
+        # wait on Cohere / Claude classification), then disambiguate all of
+        # this person's ambiguous orgs in one request
+        context = f"Person: {person_name}"
+        workers = min(self.config.get("match_workers", 1), len(unique_orgs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results: List[Union[MatchResult, _PendingLLM]] = list(
+                    executor.map(self._match_cached, unique_orgs)
+                )
+        else:
+            results = [self._match_cached(org) for org in unique_orgs]
 
-        return results
+        pending_idx = [i for i, r in enumerate(results) if isinstance(r, _PendingLLM)]
+        if pending_idx:
+            finalized = self._finalize_with_llm(
+                [results[i] for i in pending_idx], context=context
+            )
+            for i, result in zip(pending_idx, finalized):
+                results[i] = result
+
+        by_key = dict(zip(representatives, results))
+        return [replace(by_key[_norm_org_key(org)], raw_name=org) for org in org_names]
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_matcher() -> OrgMatcher:
+    """
+    Process-wide OrgMatcher with the default config and ontology.
+    Loading the ontology and embedding index happens once per process.
+    """
+    return OrgMatcher()
@@ -4,18 +4,134 @@ ontology_db.py — Single source of truth for all reads and writes to unified_on
 All other ontology_01 modules import from this. Nothing else touches the JSON file directly.
 """
 
+import bisect
+import functools
 import json
+import mmap
 import os
+import pickle
+import sys
 import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+# orjson serializes the ontology several times faster than json.dump. Its
+# OPT_INDENT_2 output matches json.dump(indent=2, ensure_ascii=False) byte for
+# byte except for float exponent spelling (1e-05 vs 0.00001).
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ONTOLOGY_PATH = Path(__file__).resolve().parent / "unified_ontology.json"
 
+# Stub classification: entries from these sources (or status pending_review)
+# are stubs; stubs in these statuses have left the review queue.
+_STUB_SOURCES = frozenset({"auto_stub"})
+_PENDING_EXCLUDE = frozenset({"dismissed", "merged", "completed"})
+
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """
+    Smallest string greater than every string starting with prefix, or None if
+    there is none (prefix is all U+10FFFF). Bounds a bisect prefix range.
+    """
+    while prefix and prefix[-1] == "\U0010ffff":
+        prefix = prefix[:-1]
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _norm(name: str) -> str:
+    """
+    Lookup key for canonical names and variations. Strips before lowercasing so
+    only the kept characters are case-mapped; str.lower() already has a fast
+    path for ASCII strings, which beat a translate()-based shortcut ~10x.
+    """
+    return name.strip().lower()
+
+
+def _intern_repeated_strings(entries: List[Dict]) -> None:
+    """
+    Point repeated field values at one shared string each. json.load creates a
+    fresh str for every value, so the handful of distinct meta_type / status /
+    source values and the heavily shared hierarchical tags would otherwise be
+    duplicated once per entry. Unique values (canonical names, variations)
+    are left alone — interning them saves nothing.
+    """
+    intern = sys.intern
+    for entry in entries:
+        for field in ("meta_type", "status", "source"):
+            value = entry.get(field)
+            if type(value) is str:
+                entry[field] = intern(value)
+        for sub in (entry.get("un_ontology"), entry.get("gov_ontology")):
+            if not sub:
+                continue
+            tags = sub.get("hierarchical_tags")
+            if tags:
+                sub["hierarchical_tags"] = [intern(t) if type(t) is str else t for t in tags]
+            ct = sub.get("canonical_tag")
+            if type(ct) is str:
+                sub["canonical_tag"] = intern(ct)
+
+
+def _read_json(path: Path) -> Dict:
+    """
+    Parse the ontology file. With orjson, parse straight from a read-only mmap
+    of the file — no intermediate str/bytes copy, ~1.5x faster than json.load.
+    Anything orjson rejects that the stdlib accepts (NaN literals, ints beyond
+    64 bits) is retried with json.load, which also reports genuine errors.
+    """
+    if orjson is not None:
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        except (ValueError, OSError):
+            # orjson.JSONDecodeError is a ValueError; so is mmap of an empty file
+            pass
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(data: Dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            # orjson.JSONEncodeError subclasses TypeError: values it can't encode
+            # (e.g. ints beyond 64 bits) go through the stdlib instead
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _hierarchical_tags(entry: Dict) -> List[str]:
+    """All non-empty hierarchical tags from both sub-ontologies."""
+    un = entry.get("un_ontology") or {}
+    gov = entry.get("gov_ontology") or {}
+    return [
+        tag
+        for tag in (*un.get("hierarchical_tags", ()), *gov.get("hierarchical_tags", ()))
+        if tag
+    ]
+
+
+class _IndexedEntry(NamedTuple):
+    """What one entry contributed to the indexes, keyed by id(entry)."""
+    position: int
+    keys: List[Tuple[Dict, Dict, str]]
+    meta_type: str
+    tags: List[str]
+    stub_buckets: Tuple[List[Dict], ...]
+
 
 class OntologyDB:
     """
     In-memory ontology store with indexed lookups. Provides atomic writes back to disk.
+    Prefer get_db() over constructing one directly.
     """
 
     def __init__(self, path: Path = ONTOLOGY_PATH):
@@ -24,115 +140,368 @@ class OntologyDB:
         self._canonical_index: Dict[str, Dict] = {}
         self._variation_index: Dict[str, Dict] = {}
         self._meta_type_index: Dict[str, List[Dict]] = {}
-        self._tag_completions: Dict[str, Set[str]] = {}
-        self._load()
-        self._build_indexes()
-
-    def _load(self) -> None:
+        # Distinct hierarchical tags sorted by lowercase form, plus the originals
+        # in the same order — a prefix completion is one bisect range
+        self._tags_lower: List[str] = []
+        self._tags_orig: List[str] = []
+        self._indexed: Dict[int, _IndexedEntry] = {}
+        self._canonical_claims: Dict[str, int] = {}
+        self._variation_claims: Dict[str, int] = {}
+        self._tag_counts: Dict[str, int] = {}
+        self._stubs: List[Dict] = []          # get_stubs(), in list order
+        self._pending_stubs: List[Dict] = []  # get_pending_stubs(), in list order
+        self._all_tags_cache: Optional[List[str]] = None
+        self._entries_view: Optional[Tuple[Dict, ...]] = None
+        self._dirty = False  # in-memory changes not yet written to disk
+        # Parsing and indexing wait for the first public call (_ensure_loaded);
+        # only a missing file is reported up front
+        self._loaded = False
+        # Guards loading and every mutation; reentrant so writers can load lazily
+        self._lock = threading.RLock()
+        self._require_file()
+
+    def _require_file(self) -> None:
         if not self._path.exists():
             raise FileNotFoundError(
                 f"Ontology file not found at: {self._path}\n"
                 "Expected unified_ontology.json in the ontology_01 service directory."
             )
-        with open(self._path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if "unified_ontology" not in data:
-            raise ValueError(
-                f"Expected root key 'unified_ontology' in {self._path}, "
-                f"but found keys: {list(data.keys())}"
-            )
-        self._entries = data["unified_ontology"]
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                self._build_indexes()
+                self._loaded = True
+
+    def _load(self) -> None:
+        self._require_file()
+        stamp = self._file_stamp()
+        entries = self._read_sidecar(stamp)
+        if entries is None:
+            data = _read_json(self._path)
+            if "unified_ontology" not in data:
+                raise ValueError(
+                    f"Expected root key 'unified_ontology' in {self._path}, "
+                    f"but found keys: {list(data.keys())}"
+                )
+            entries = data["unified_ontology"]
+            _intern_repeated_strings(entries)
+            self._write_sidecar(stamp, entries)
+        else:
+            _intern_repeated_strings(entries)
+        self._entries = entries
+
+    # ── Binary sidecar ────────────────────────────────────────────────────────
+    # A pickle of the parsed entries next to the JSON, stamped with the JSON's
+    # (mtime_ns, size). Unpickling is ~1.5x faster than json.load on a cold
+    # start; any edit to the JSON changes the stamp and the sidecar is ignored
+    # and rewritten. It is a local cache only — failures are non-fatal.
+
+    def _sidecar_path(self) -> Path:
+        return self._path.with_suffix(".pickle")
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        st = os.stat(self._path)
+        return st.st_mtime_ns, st.st_size
+
+    def _read_sidecar(self, stamp: Tuple[int, int]) -> Optional[List[Dict]]:
+        try:
+            with open(self._sidecar_path(), "rb") as f:
+                cached_stamp, entries = pickle.load(f)
+        except Exception:
+            return None
+        if tuple(cached_stamp) != stamp or not isinstance(entries, list):
+            return None
+        return entries
+
+    def _write_sidecar(self, stamp: Tuple[int, int], entries: List[Dict]) -> None:
+        sidecar = self._sidecar_path()
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp", prefix=".ontology_")
+        except OSError:
+            return  # cache failure is non-fatal
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, sidecar)
+        except (OSError, pickle.PicklingError):
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
 
     def _build_indexes(self) -> None:
-        self._canonical_index = {}
-        self._variation_index = {}
+        """
+        Index every entry from scratch (init/reload). Produces the same state as
+        calling _index_entry() on each entry in order, in one tight pass: entries
+        arrive in list order, so each key simply goes to the latest claimant and
+        meta-type buckets can be appended to.
+        """
+        canonical = self._canonical_index = {}
+        variation = self._variation_index = {}
         self._meta_type_index = {}
-        self._tag_completions = {}
-
-        for entry in self._entries:
-            # Canonical index
-            cname = entry.get("canonical_name", "")
+        indexed = self._indexed = {}
+        canonical_claims = self._canonical_claims = {}
+        variation_claims = self._variation_claims = {}
+        tag_counts = self._tag_counts = {}
+        self._stubs = []
+        self._pending_stubs = []
+        self._all_tags_cache = None
+        self._entries_view = None
+        meta_bucket = self._meta_type_index.setdefault
+        canonical_claim = canonical_claims.get
+        variation_claim = variation_claims.get
+        tag_count = tag_counts.get
+
+        for position, entry in enumerate(self._entries):
+            get = entry.get
+            keys = []
+
+            cname = get("canonical_name", "")
             if cname:
-                self._canonical_index[cname.lower().strip()] = entry
+                key = _norm(cname)
+                canonical[key] = entry
+                canonical_claims[key] = canonical_claim(key, 0) + 1
+                keys.append((canonical, canonical_claims, key))
 
-            # Variation index
-            for var in entry.get("variations_found", []):
+            for var in get("variations_found", []):
                 if var:
-                    self._variation_index[var.lower().strip()] = entry
+                    key = _norm(var)
+                    variation[key] = entry
+                    variation_claims[key] = variation_claim(key, 0) + 1
+                    keys.append((variation, variation_claims, key))
 
-            # Meta-type index
-            meta = entry.get("meta_type", "")
+            meta = get("meta_type", "")
             if meta:
-                self._meta_type_index.setdefault(meta, []).append(entry)
-
-            # Tag trie — collect all hierarchical tags from both sub-ontologies
-            all_tags: List[str] = []
-            un = entry.get("un_ontology") or {}
-            gov = entry.get("gov_ontology") or {}
-            all_tags.extend(un.get("hierarchical_tags", []))
-            all_tags.extend(gov.get("hierarchical_tags", []))
-
-            for tag in all_tags:
-                if not tag:
-                    continue
-                # Store the full tag keyed by every prefix of itself
-                parts = tag.split(":")
-                for i in range(1, len(parts) + 1):
-                    prefix = ":".join(parts[:i])
-                    self._tag_completions.setdefault(prefix, set()).add(tag)
-                # Also key by empty string so "get all tags" works
-                self._tag_completions.setdefault("", set()).add(tag)
+                meta_bucket(meta, []).append(entry)
+
+            tags = _hierarchical_tags(entry)
+            for tag in tags:
+                tag_counts[tag] = tag_count(tag, 0) + 1
+
+            stub_buckets = self._stub_buckets(entry)
+            for bucket in stub_buckets:
+                bucket.append(entry)
+
+            indexed[id(entry)] = _IndexedEntry(position, keys, meta, tags, stub_buckets)
+
+        pairs = sorted((tag.lower(), tag) for tag in tag_counts)
+        self._tags_lower = [lower for lower, _ in pairs]
+        self._tags_orig = [tag for _, tag in pairs]
+
+    # ── Incremental index maintenance ─────────────────────────────────────────
+    # Writes touch only the entries they change. Entries are only ever appended
+    # or replaced in place, so list positions are stable and decide which entry
+    # owns a canonical/variation key shared by several (the last one, as in a
+    # full rebuild). The *_claims counters record how many entries share a key,
+    # so the list is only rescanned when an owner goes away and others remain.
+    # Each entry's keys are snapshotted when indexed: callers sometimes mutate
+    # an entry's lists in place before update_entry(), and unindexing must undo
+    # what was actually indexed.
+
+    def _index_keys(self, entry: Dict) -> List[Tuple[Dict, Dict, str]]:
+        """(index, claims, key) for the canonical name and every variation."""
+        keys = []
+        cname = entry.get("canonical_name", "")
+        if cname:
+            keys.append((self._canonical_index, self._canonical_claims, _norm(cname)))
+        for var in entry.get("variations_found", []):
+            if var:
+                keys.append((self._variation_index, self._variation_claims, _norm(var)))
+        return keys
+
+    def _stub_buckets(self, entry: Dict) -> Tuple[List[Dict], ...]:
+        """The stub lists an entry belongs in: none, all stubs, or all + pending."""
+        status = entry.get("status")
+        if not (status == "pending_review" or entry.get("source") in _STUB_SOURCES):
+            return ()
+        if status in _PENDING_EXCLUDE:
+            return (self._stubs,)
+        return (self._stubs, self._pending_stubs)
+
+    def _position_of(self, entry: Dict) -> int:
+        return self._indexed[id(entry)].position
+
+    def _index_entry(self, entry: Dict, position: Optional[int] = None) -> None:
+        """
+        Add one entry to every index. position is its slot in _entries;
+        defaults to the last slot (the entry was just appended).
+        """
+        if position is None:
+            position = len(self._entries) - 1
+        keys = self._index_keys(entry)
+        meta = entry.get("meta_type", "")
+        tags = _hierarchical_tags(entry)
+        stub_buckets = self._stub_buckets(entry)
+        self._indexed[id(entry)] = _IndexedEntry(position, keys, meta, tags, stub_buckets)
+        self._all_tags_cache = None
+        self._entries_view = None
+
+        for index, claims, key in keys:
+            claims[key] = claims.get(key, 0) + 1
+            owner = index.get(key)
+            if owner is None or self._position_of(owner) <= position:
+                index[key] = entry
+
+        if meta:
+            bucket = self._meta_type_index.setdefault(meta, [])
+            bisect.insort(bucket, entry, key=self._position_of)
+
+        for bucket in stub_buckets:
+            bisect.insort(bucket, entry, key=self._position_of)
+
+        for tag in tags:
+            count = self._tag_counts.get(tag, 0)
+            self._tag_counts[tag] = count + 1
+            if not count:
+                self._tag_insert(tag)
+
+    def _unindex_entry(self, entry: Dict) -> None:
+        """Remove one entry (still at its slot in _entries) from every index."""
+        indexed = self._indexed[id(entry)]
+        self._all_tags_cache = None
+        self._entries_view = None
+
+        for index, claims, key in indexed.keys:
+            remaining = claims[key] - 1
+            if remaining:
+                claims[key] = remaining
+            else:
+                del claims[key]
+            if index.get(key) is entry:
+                owner = self._last_claimant(index, key, entry) if remaining else None
+                if owner is None:
+                    del index[key]
+                else:
+                    index[key] = owner
+
+        if indexed.meta_type:
+            bucket = self._meta_type_index[indexed.meta_type]
+            del bucket[bisect.bisect_left(bucket, indexed.position, key=self._position_of)]
+            if not bucket:
+                del self._meta_type_index[indexed.meta_type]
+
+        for bucket in indexed.stub_buckets:
+            del bucket[bisect.bisect_left(bucket, indexed.position, key=self._position_of)]
+
+        for tag in indexed.tags:
+            count = self._tag_counts[tag] - 1
+            if count:
+                self._tag_counts[tag] = count
+                continue
+            del self._tag_counts[tag]
+            self._tag_remove(tag)
+
+        del self._indexed[id(entry)]
+
+    def _tag_insert(self, tag: str) -> None:
+        lower = tag.lower()
+        i = bisect.bisect_right(self._tags_lower, lower)
+        self._tags_lower.insert(i, lower)
+        self._tags_orig.insert(i, tag)
+
+    def _tag_remove(self, tag: str) -> None:
+        lower = tag.lower()
+        i = bisect.bisect_left(self._tags_lower, lower)
+        # Tags differing only in case share a lowercase form; find this one
+        while self._tags_orig[i] != tag:
+            i += 1
+        del self._tags_lower[i]
+        del self._tags_orig[i]
+
+    def _last_claimant(self, index: Dict, key: str, exclude: Dict) -> Optional[Dict]:
+        """The last indexed entry other than exclude that holds key in index."""
+        for entry in reversed(self._entries):
+            indexed = self._indexed.get(id(entry))
+            if entry is exclude or indexed is None:
+                continue
+            for idx, _claims, k in indexed.keys:
+                if idx is index and k == key:
+                    return entry
+        return None
 
     # -------------------------------------------------------------------------
     # Read operations
     # -------------------------------------------------------------------------
 
-    def get_all(self) -> List[Dict]:
-        """Return a shallow copy of all entries."""
+    def get_all(self) -> Tuple[Dict, ...]:
+        """
+        Return all entries as a tuple snapshot, shared between calls until the
+        next write (no per-call copy). The entry dicts are the live ones — treat
+        them as read-only and go through update_entry(). Use get_all_copy() for
+        a list you can modify.
+        """
+        self._ensure_loaded()
+        if self._entries_view is None:
+            self._entries_view = tuple(self._entries)
+        return self._entries_view
+
+    def get_all_copy(self) -> List[Dict]:
+        """Return a shallow copy of all entries as a new list."""
+        self._ensure_loaded()
         return list(self._entries)
 
     def get_by_meta_type(self, meta_type: str) -> List[Dict]:
         """Return all entries matching the given meta_type."""
+        self._ensure_loaded()
         return list(self._meta_type_index.get(meta_type, []))
 
     def lookup_canonical(self, name: str) -> Optional[Dict]:
         """Case-insensitive exact lookup on canonical_name."""
-        return self._canonical_index.get(name.lower().strip())
+        self._ensure_loaded()
+        return self._canonical_index.get(_norm(name))
 
     def lookup_variation(self, name: str) -> Optional[Dict]:
         """Case-insensitive exact lookup across all variations_found strings."""
-        return self._variation_index.get(name.lower().strip())
+        self._ensure_loaded()
+        return self._variation_index.get(_norm(name))
+
+    def lookup_exact(self, name: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        lookup_canonical, then lookup_variation, normalizing name once.
+        Returns (entry, "canonical" | "variation"), or (None, None).
+        """
+        self._ensure_loaded()
+        key = _norm(name)
+        entry = self._canonical_index.get(key)
+        if entry is not None:
+            return entry, "canonical"
+        entry = self._variation_index.get(key)
+        if entry is not None:
+            return entry, "variation"
+        return None, None
 
     def get_all_tags(self) -> List[str]:
-        """Return all distinct canonical_tag values across all entries."""
-        tags: Set[str] = set()
-        for entry in self._entries:
-            un = entry.get("un_ontology") or {}
-            gov = entry.get("gov_ontology") or {}
-            ct = un.get("canonical_tag") or gov.get("canonical_tag")
-            if ct:
-                tags.add(ct)
-        return sorted(tags)
+        """
+        Return all distinct canonical_tag values across all entries.
+        Computed on first call after a write and cached until the next one.
+        """
+        self._ensure_loaded()
+        if self._all_tags_cache is None:
+            tags: Set[str] = set()
+            for entry in self._entries:
+                un = entry.get("un_ontology") or {}
+                gov = entry.get("gov_ontology") or {}
+                ct = un.get("canonical_tag") or gov.get("canonical_tag")
+                if ct:
+                    tags.add(ct)
+            self._all_tags_cache = sorted(tags)
+        return list(self._all_tags_cache)
 
     def get_tag_completions(self, prefix: str) -> List[str]:
         """
         Return all canonical/hierarchical tags that start with the given prefix.
         Used for the Streamlit autocomplete widget.
         """
-        prefix = prefix.strip()
-        matches: Set[str] = set()
-
-        if not prefix:
-            return sorted(self._tag_completions.get("", set()))
-
-        # Direct prefix lookup in trie
-        for stored_prefix, tags in self._tag_completions.items():
-            if stored_prefix.lower().startswith(prefix.lower()) or prefix.lower().startswith(stored_prefix.lower()):
-                for tag in tags:
-                    if tag.lower().startswith(prefix.lower()):
-                        matches.add(tag)
-
-        return sorted(matches)
+        self._ensure_loaded()
+        prefix = prefix.strip().lower()
+        lo = bisect.bisect_left(self._tags_lower, prefix)
+        upper = _prefix_upper_bound(prefix) if prefix else None
+        hi = len(self._tags_lower) if upper is None else bisect.bisect_left(self._tags_lower, upper)
+        return sorted(self._tags_orig[lo:hi])
 
     def get_stubs(self) -> List[Dict]:
         """
@@ -140,68 +509,103 @@ class OntologyDB:
         Includes pending, dismissed, and merged — callers filter as needed.
         Use get_pending_stubs() for the active review queue.
         """
-        return [
-            e for e in self._entries
-            if e.get("source") in ("auto_stub",) or e.get("status") == "pending_review"
-        ]
+        self._ensure_loaded()
+        return list(self._stubs)
 
     def get_pending_stubs(self) -> List[Dict]:
         """Return stubs that are still pending review (not dismissed, merged, or approved)."""
-        return [
-            e for e in self.get_stubs()
-            if e.get("status") not in ("dismissed", "merged", "completed")
-        ]
+        self._ensure_loaded()
+        return list(self._pending_stubs)
 
     def count(self) -> int:
+        self._ensure_loaded()
         return len(self._entries)
 
     # -------------------------------------------------------------------------
     # Write operations
     # -------------------------------------------------------------------------
 
-    def add_entry(self, entry: Dict) -> None:
-        """Append a new entry, rebuild indexes, and write to disk."""
-        self._entries.append(entry)
-        self._build_indexes()
-        self._atomic_write()
+    # Every mutator takes defer_write: pass True to keep the change in memory
+    # only and call save() once after a batch of changes.
 
-    def add_entries(self, entries: List[Dict]) -> None:
-        """Append multiple entries in one write — more efficient than add_entry() in a loop."""
-        self._entries.extend(entries)
-        self._build_indexes()
-        self._atomic_write()
+    def add_entry(self, entry: Dict, defer_write: bool = False) -> None:
+        """Append a new entry, index it, and write to disk."""
+        with self._lock:
+            self._ensure_loaded()
+            self._entries.append(entry)
+            self._index_entry(entry)
+            self._mark_dirty(defer_write)
 
-    def update_entry(self, canonical_name: str, updates: Dict) -> bool:
+    def add_entries(self, entries: List[Dict], defer_write: bool = False) -> None:
+        """Append multiple entries in one write — more efficient than add_entry() in a loop."""
+        with self._lock:
+            self._ensure_loaded()
+            start = len(self._entries)
+            self._entries.extend(entries)
+            for position, entry in enumerate(entries, start):
+                self._index_entry(entry, position)
+            self._mark_dirty(defer_write)
+
+    def update_entry(self, canonical_name: str, updates: Dict, defer_write: bool = False) -> bool:
         """
         Find entry by canonical_name (exact, case-insensitive), apply updates, write to disk.
         Returns True if found and updated, False if not found.
         """
-        key = canonical_name.lower().strip()
-        for i, entry in enumerate(self._entries):
-            if entry.get("canonical_name", "").lower().strip() == key:
-                self._entries[i] = {**entry, **updates}
-                self._build_indexes()
-                self._atomic_write()
-                return True
-        return False
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._canonical_index.get(_norm(canonical_name))
+            if entry is None:
+                return False
+            i = self._position_of(entry)
+            self._unindex_entry(entry)
+            self._entries[i] = {**entry, **updates}
+            self._index_entry(self._entries[i], i)
+            self._mark_dirty(defer_write)
+            return True
+
+    def save(self, force: bool = False, fsync: bool = True) -> None:
+        """
+        Write deferred changes to disk. No-op if nothing changed since the last
+        write, unless force=True (e.g. after editing entries in place).
+        fsync=False skips flushing to stable storage — for interim checkpoints
+        where losing the last write to a power cut is acceptable.
+        """
+        with self._lock:
+            if self._dirty or force:
+                self._ensure_loaded()  # dirty implies loaded; force on a fresh handle doesn't
+                self._atomic_write(fsync=fsync)
 
-    def save(self) -> None:
-        """Force write current state to disk."""
-        self._atomic_write()
+    def _mark_dirty(self, defer_write: bool) -> None:
+        self._dirty = True
+        if not defer_write:
+            self._atomic_write()
 
-    def _atomic_write(self) -> None:
+    def _atomic_write(self, fsync: bool = True) -> None:
         """
         Write to a temp file then os.replace() for atomicity.
         Prevents corruption on crash mid-write. Works on Windows.
+        With fsync, the data is on disk before the rename, so a power cut can't
+        leave the new name pointing at unwritten blocks, and (on POSIX) the
+        rename itself is flushed via the directory.
         """
         data = {"unified_ontology": self._entries}
         dir_ = self._path.parent
         # Write to a temp file in the same directory (ensures same filesystem for os.replace)
         fd, tmp_path = tempfile.mkstemp(dir=dir_, suffix=".tmp", prefix=".ontology_")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if hasattr(os, "posix_fadvise"):
+                # One sequential pass over a fresh file; POSIX only, a hint at most
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_dump_json(data))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp_path, self._path)
+            if fsync and os.name == "posix":
+                self._fsync_dir(dir_)
+            self._write_sidecar(self._file_stamp(), self._entries)
+            self._dirty = False
         except Exception:
             # Clean up temp file on failure
             try:
@@ -210,7 +614,41 @@ class OntologyDB:
                 pass
             raise
 
+    @staticmethod
+    def _fsync_dir(dir_: Path) -> None:
+        # Best effort: some filesystems refuse fsync on a directory
+        try:
+            dir_fd = os.open(dir_, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
     def reload(self) -> None:
-        """Reload from disk and rebuild indexes. Useful after external modifications."""
-        self._load()
-        self._build_indexes()
+        """
+        Reload from disk and rebuild indexes. Useful after external modifications.
+        Discards any deferred changes that were not saved.
+        """
+        with self._lock:
+            self._load()
+            self._build_indexes()
+            self._loaded = True
+            self._dirty = False
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_db(path: Path) -> OntologyDB:
+    return OntologyDB(path)
+
+
+def get_db(path: Path = ONTOLOGY_PATH) -> OntologyDB:
+    """
+    Process-wide OntologyDB for path, so modules in one process share a single
+    parse and index instead of each constructing their own. Writes through it
+    are seen by every holder; call reload() after the file changes externally.
+    """
+    return _shared_db(Path(path).resolve())
@@ -10,11 +10,20 @@ Run with:
     streamlit run services/ontology_01/review_app.py
 """
 
+import atexit
+import functools
 import json
+import os
+import re
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 # ── Path setup ────────────────────────────────────────────────────────────────
@@ -22,10 +31,19 @@ _SERVICE_DIR = Path(__file__).resolve().parent
 _PROJECT_ROOT = _SERVICE_DIR.parent.parent
 TIMELINE_DATA_DIR = _PROJECT_ROOT / "services" / "WikiPrompt" / "llm_timeline_data"
 
+# Expanders rendered per page on the review queues
+REVIEW_PAGE_SIZE = 20
+
+# Buffered sidecar edits are written out after this many, or on "Flush changes"
+SIDECAR_FLUSH_EVERY = 10
+
 sys.path.insert(0, str(_SERVICE_DIR))
 
-from ontology_db import OntologyDB
+# Sidecars go through the same orjson-with-stdlib-fallback codec as the ontology
+from ontology_db import OntologyDB, _dump_json, _read_json
 from enrichment import enrich_stub, merge_stub_into_entry, get_confirmed_orgs
+from matcher import MatchResult, _get_ontology_tag
+from run_matching import build_stub
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Page config (must be first Streamlit call)
@@ -45,99 +63,367 @@ st.set_page_config(
 
 @st.cache_resource
 def get_db() -> OntologyDB:
-    """Shared OntologyDB instance. Call st.cache_resource.clear() after mutations."""
+    """Shared OntologyDB instance. Call reload_db() after mutations."""
     return OntologyDB(_SERVICE_DIR / "unified_ontology.json")
 
 
+@st.cache_resource
+def _db_state() -> Dict[str, int]:
+    """Process-wide ontology version, bumped by reload_db(). Keys derived caches."""
+    return {"version": 0}
+
+
+def db_version() -> int:
+    """Current ontology version — pass to st.cache_data functions as a key."""
+    return _db_state()["version"]
+
+
 def reload_db() -> None:
     """Clear cache and force DB reload on next access."""
-    st.cache_resource.clear()
+    # Only the DB resource — the sidecar cache stays valid across DB reloads
+    get_db.clear()
+    _db_state()["version"] += 1
+    st.session_state.pop("browser_opts", None)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_tag_completions(prefix: str, version: int) -> List[str]:
+    """Tag completions per (prefix, DB version); `version` only keys the cache."""
+    return get_db().get_tag_completions(prefix)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Sidecar file helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Directories under the timeline tree that never hold sidecars
+_SKIP_DIRS = frozenset({
+    "__pycache__", ".git", ".venv", "venv", "node_modules", ".ipynb_checkpoints",
+})
+
+
+def _scandir_json(root: Path):
+    """
+    Recursively yield os.DirEntry objects for *_org_links.json files under root.
+    DirEntry caches the d_type from the directory read, so is_dir()/is_file()
+    cost no extra stat() calls. A missing root yields nothing (like rglob).
+    Directories named in _SKIP_DIRS are not descended into.
+    """
+    try:
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        yield from _scandir_json(entry.path)
+                elif entry.is_file() and entry.name.endswith("_org_links.json"):
+                    yield entry
+    except OSError:
+        return
+
+
+@st.cache_resource
+def _sidecar_cache() -> Dict[str, Tuple[Tuple[int, int], Optional[Dict]]]:
+    """
+    Parsed sidecars by path, with the (mtime_ns, size) stamp they were read at.
+    A cache_resource so it outlives reruns (Streamlit re-executes this module)
+    and is shared across sessions. Unreadable files are cached as None.
+    """
+    return {}
+
+
 def load_all_sidecar_files() -> List[Dict]:
-    """Load all *_org_links.json sidecar files from the timeline data directory."""
-    sidecars = []
-    for path in sorted(TIMELINE_DATA_DIR.rglob("*_org_links.json")):
+    """
+    Load all *_org_links.json sidecar files from the timeline data directory.
+    Only files whose mtime or size changed since the last call are re-parsed.
+    """
+    cache = _sidecar_cache()
+    stamps: Dict[Path, Tuple[int, int]] = {}
+    for entry in _scandir_json(TIMELINE_DATA_DIR):
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            data["_file_path"] = str(path)
+            info = entry.stat()
+        except OSError:
+            continue
+        stamps[Path(entry.path)] = (info.st_mtime_ns, info.st_size)
+
+    stale = [p for p, stamp in stamps.items() if cache.get(str(p), (None,))[0] != stamp]
+    if len(stale) > 1:
+        # Overlap file reads across threads; map() keeps results in input order
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+            results = list(executor.map(_read_one_sidecar, stale))
+    else:
+        results = [_read_one_sidecar(p) for p in stale]
+    for path, data in zip(stale, results):
+        cache[str(path)] = (stamps[path], data)
+
+    if len(cache) > len(stamps):
+        # Some cached sidecars were deleted or moved
+        live = {str(p) for p in stamps}
+        for key in [k for k in cache if k not in live]:
+            del cache[key]
+
+    # Sort by path so ordering matches the old sorted(rglob(...))
+    sidecars = []
+    for path in sorted(stamps):
+        data = cache[str(path)][1]
+        if data is not None:
             sidecars.append(data)
-        except (json.JSONDecodeError, OSError):
-            pass
     return sidecars
 
 
-def get_pending_reviews(sidecars: List[Dict]) -> List[Dict]:
+def _read_one_sidecar(path: Path) -> Optional[Dict]:
+    """Parse one sidecar, tagging it with its path. None if unreadable."""
+    try:
+        data = _read_json(path)
+    except (json.JSONDecodeError, OSError):
+        return None
+    data["_file_path"] = str(path)
+    if "review_needed_count" not in data:
+        # Legacy sidecar without the counter — derive it once here so the
+        # sidebar can sum counters instead of scanning every link
+        data["review_needed_count"] = sum(
+            1 for l in data.get("org_links", []) if l.get("needs_review")
+        )
+    return data
+
+
+def _pending_links(sidecar: Dict) -> Tuple[Dict, ...]:
     """
-    Collect all org_links where needs_review=True across all sidecar files.
-    Returns enriched list with person_name and file_path added.
+    The sidecar's org_links with needs_review=True, computed once per loaded
+    sidecar and memoized on it. Cached sidecars are replaced, never mutated,
+    when an edit lands, so the memo can't go stale; it is never written out.
+    """
+    pending = sidecar.get("_pending_links")
+    if pending is None:
+        pending = tuple(l for l in sidecar.get("org_links", ()) if l.get("needs_review"))
+        sidecar["_pending_links"] = pending
+    return pending
+
+
+def iter_pending_reviews(sidecars: List[Dict]) -> Iterator[Dict]:
+    """
+    Lazily yield every org_link with needs_review=True across all sidecar files,
+    copied and tagged with person_name and _sidecar_file_path.
     """
-    pending = []
     for sidecar in sidecars:
+        pending = _pending_links(sidecar)
+        if not pending:
+            continue
         person = sidecar.get("person_name", "Unknown")
         file_path = sidecar.get("_file_path", "")
-        for link in sidecar.get("org_links", []):
-            if link.get("needs_review"):
-                pending.append({
-                    **link,
-                    "person_name": person,
-                    "_sidecar_file_path": file_path,
-                })
-    return pending
+        for link in pending:
+            item = link.copy()
+            item["person_name"] = person
+            item["_sidecar_file_path"] = file_path
+            yield item
+
+
+def get_pending_reviews(sidecars: List[Dict]) -> List[Dict]:
+    """
+    Collect all org_links where needs_review=True across all sidecar files.
+    Returns enriched list with person_name and file_path added.
+    """
+    return list(iter_pending_reviews(sidecars))
+
+
+class _BufferedSidecar(NamedTuple):
+    data: Dict                      # file content with every buffered edit applied
+    index: Dict[str, int]           # raw_name -> position in data["org_links"]
+    stamp: Tuple[int, int]          # (mtime_ns, size) of the file data was read from
+    edits: List[Tuple[str, Dict]]   # (raw_name, updates), replayed if the file changes
+
+
+class _SidecarWriteBuffer:
+    """
+    Write-behind buffer for sidecar edits, held until flush(). One per process,
+    shared by all sessions, and flushed at interpreter exit. A sidecar that was
+    rewritten on disk meanwhile (e.g. by run_matching) is re-read and the edits
+    replayed onto it, so the flush never clobbers newer content.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.files: Dict[str, _BufferedSidecar] = {}
+        self.unflushed = 0
+
+    def flush(self) -> List[Tuple[Path, Dict]]:
+        """Write each buffered sidecar once. Returns the (path, data) written."""
+        with self.lock:
+            written = []
+            for key, buffered in list(self.files.items()):
+                path = Path(key)
+                data = buffered.data
+                stamp = _file_stamp(path)
+                if stamp is None:
+                    del self.files[key]  # sidecar deleted; nothing to update
+                    continue
+                if stamp != buffered.stamp:
+                    data = _read_json(path)
+                    index = _raw_name_index(data)
+                    for raw_name, updates in buffered.edits:
+                        _apply_link_update(data, index, raw_name, updates)
+                _write_sidecar_atomic(path, data)
+                del self.files[key]
+                written.append((path, data))
+            self.unflushed = 0
+            return written
+
+
+@st.cache_resource
+def _write_buffer() -> _SidecarWriteBuffer:
+    """The process-wide sidecar write buffer (a cache_resource, so it survives reruns)."""
+    buf = _SidecarWriteBuffer()
+    atexit.register(buf.flush)
+    return buf
+
+
+def flush_sidecar_writes() -> int:
+    """Write all buffered sidecar edits to disk. Returns the number of files written."""
+    cache = _sidecar_cache()
+    written = _write_buffer().flush()
+    for path, data in written:
+        cache[str(path)] = (_file_stamp(path), {**data, "_file_path": str(path)})
+    return len(written)
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of path, or None if it doesn't exist."""
+    try:
+        info = path.stat()
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+
+def _apply_link_update(
+    data: Dict, index: Dict[str, int], raw_name: str, updates: Dict,
+) -> Optional[bool]:
+    """
+    Apply updates to the org_link named raw_name in a parsed sidecar, keeping
+    the summary counts in step. Returns None if there is no such link, False
+    if the updates were already applied, True if the sidecar changed.
+    """
+    i = index.get(raw_name)
+    if i is None:
+        return None
+    link = data["org_links"][i]
+    new_link = {**link, **updates}
+    if new_link == link:
+        return False
+    data["org_links"][i] = new_link
+    # Update summary counts by the change in this one link;
+    # recount only if the sidecar predates the counters
+    if "matched_count" in data and "review_needed_count" in data:
+        data["matched_count"] += (
+            bool(new_link.get("matched")) - bool(link.get("matched"))
+        )
+        data["review_needed_count"] += (
+            bool(new_link.get("needs_review")) - bool(link.get("needs_review"))
+        )
+    else:
+        matched = review = 0
+        for l in data["org_links"]:
+            matched += bool(l.get("matched"))
+            review += bool(l.get("needs_review"))
+        data["matched_count"] = matched
+        data["review_needed_count"] = review
+    return True
 
 
 def update_sidecar_link(
     sidecar_file_path: str,
     raw_name: str,
     updates: Dict,
+    defer_write: bool = False,
 ) -> bool:
     """
     Update a specific org_link in a sidecar file.
     Finds the link by raw_name and applies updates.
     Returns True on success.
+    The edit is buffered and written with other edits to the same file; see
+    SIDECAR_FLUSH_EVERY and flush_sidecar_writes(). With defer_write=True the
+    periodic flush is skipped too — call flush_sidecar_writes() when done.
     """
     path = Path(sidecar_file_path)
-    if not path.exists():
-        return False
+    key = str(path)
+    buf = _write_buffer()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for i, link in enumerate(data.get("org_links", [])):
-            if link.get("raw_name") == raw_name:
-                data["org_links"][i] = {**link, **updates}
-                # Update summary counts
-                data["matched_count"] = sum(
-                    1 for l in data["org_links"] if l.get("matched")
-                )
-                data["review_needed_count"] = sum(
-                    1 for l in data["org_links"] if l.get("needs_review")
-                )
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                return True
+        with buf.lock:
+            buffered = buf.files.get(key)
+            stamp = _file_stamp(path)
+            if stamp is None:
+                return False
+            if buffered is None or buffered.stamp != stamp:
+                # First edit, or the file changed on disk since: start from the
+                # current content and replay any edits already buffered
+                data = _read_json(path)
+                index = _raw_name_index(data)
+                edits = buffered.edits if buffered is not None else []
+                for name, upd in edits:
+                    _apply_link_update(data, index, name, upd)
+                buffered = _BufferedSidecar(data, index, stamp, edits)
+            changed = _apply_link_update(buffered.data, buffered.index, raw_name, updates)
+            if changed is None:
+                return False
+            if not changed:
+                return True  # already applied (e.g. a double-click) — nothing to write
+            buffered.edits.append((raw_name, updates))
+            buf.files[key] = buffered
+            buf.unflushed += 1
+            flush_due = buf.unflushed >= SIDECAR_FLUSH_EVERY
+            # Show the buffered state on the next rerun without touching disk:
+            # keyed by the file's on-disk stamp, so nothing gets re-parsed
+            _sidecar_cache()[key] = (buffered.stamp, {**buffered.data, "_file_path": key})
     except (json.JSONDecodeError, OSError, KeyError):
-        pass
-    return False
+        return False
+    if flush_due and not defer_write:
+        try:
+            flush_sidecar_writes()
+        except (json.JSONDecodeError, OSError):
+            pass  # whatever didn't get written stays buffered for the next flush
+    return True
+
+
+def _write_sidecar_atomic(path: Path, data: Dict) -> None:
+    """
+    Write to a temp file in the same directory then os.replace() it over the
+    sidecar, so a crash mid-write never leaves a truncated file behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp", prefix=".sidecar_")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dump_json(data))
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _raw_name_index(sidecar: Dict) -> Dict[str, int]:
+    """Map raw_name -> position in org_links. Duplicates keep the first link."""
+    index: Dict[str, int] = {}
+    for i, link in enumerate(sidecar.get("org_links", [])):
+        index.setdefault(link.get("raw_name"), i)
+    return index
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tag helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
-def build_hierarchical_tags(tag: str) -> List[str]:
+@functools.lru_cache(maxsize=4096)
+def build_hierarchical_tags(tag: str) -> Tuple[str, ...]:
     """
     Build the hierarchical_tags array from a canonical_tag string.
     Supports multiple tags separated by ";".
-    "UN:Foo:Bar" -> ["UN", "UN:Foo", "UN:Foo:Bar"]
-    "UN:Foo ; ngo:research" -> ["UN", "UN:Foo", "ngo", "ngo:research"]
+    "UN:Foo:Bar" -> ("UN", "UN:Foo", "UN:Foo:Bar")
+    "UN:Foo ; ngo:research" -> ("UN", "UN:Foo", "ngo", "ngo:research")
+    Memoized, so the result is an immutable tuple — list() it before storing.
     """
     if not tag:
-        return []
+        return ()
     all_htags: List[str] = []
     for single_tag in tag.split(";"):
         single_tag = single_tag.strip()
@@ -148,29 +434,91 @@ def build_hierarchical_tags(tag: str) -> List[str]:
             ":".join(parts[:i]) for i in range(1, len(parts) + 1)
         )
     # Deduplicate while preserving order
-    seen: set = set()
-    result: List[str] = []
-    for ht in all_htags:
-        if ht not in seen:
-            seen.add(ht)
-            result.append(ht)
-    return result
+    return tuple(dict.fromkeys(all_htags))
 
 
-def _parse_tags(tag_str: str) -> List[str]:
-    """Parse a ';'-separated tag string into a list of clean individual tags."""
-    return [t.strip() for t in tag_str.split(";") if t.strip()]
+# Separator plus surrounding whitespace, so split pieces need no per-token strip
+_TAG_SPLIT = re.compile(r"\s*;\s*")
 
 
-def _canonical_tag_from_tags(tags: List[str]) -> str:
+@functools.lru_cache(maxsize=4096)
+def _parse_tags(tag_str: str) -> Tuple[str, ...]:
+    """Parse a ';'-separated tag string into a tuple of clean individual tags."""
+    return tuple(filter(None, _TAG_SPLIT.split(tag_str.strip())))
+
+
+def _canonical_tag_from_tags(tags: Sequence[str]) -> str:
     """Return the first tag as the primary canonical_tag (for DB storage)."""
     return tags[0] if tags else ""
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# JSON preview
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _json_preview(entry: Dict, key: str) -> None:
+    """
+    Show an entry as a plain pretty-printed code block, which renders far
+    faster than st.json's interactive tree. The tree is one toggle away.
+    """
+    if st.toggle("Interactive view", key=f"json_tree_{key}"):
+        st.json(entry, expanded=False)
+    else:
+        st.code(_dump_json(entry).decode("utf-8"), language="json")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pagination
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _paginate(items: List, key: str) -> Tuple[List, int]:
+    """
+    Return (items on the selected page, offset of the first one). Adds a page
+    selector only when there is more than one page, so widget construction per
+    rerun is bounded by REVIEW_PAGE_SIZE rather than the queue length.
+    """
+    n_pages = max(1, -(-len(items) // REVIEW_PAGE_SIZE))
+    if n_pages == 1:
+        return items, 0
+    # The queue may have shrunk since the page was chosen
+    if st.session_state.get(key, 1) > n_pages:
+        st.session_state[key] = n_pages
+    page_num = st.number_input(
+        f"Page (of {n_pages})", min_value=1, max_value=n_pages, key=key,
+    )
+    start = (page_num - 1) * REVIEW_PAGE_SIZE
+    return items[start:start + REVIEW_PAGE_SIZE], start
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Page 1: Pending Match Reviews
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _approval_updates(db: OntologyDB, item: Dict) -> Dict:
+    """Sidecar link updates that accept a pending item's proposed match."""
+    proposed = item.get("proposed_match_canonical", "")
+    entry = db.lookup_canonical(proposed) if proposed else None
+    ontology_tag = None
+    meta_type = item.get("meta_type")
+    if entry:
+        ontology_tag = _get_ontology_tag(entry)
+        meta_type = entry.get("meta_type", meta_type)
+    return {
+        "matched": True,
+        "needs_review": False,
+        "canonical_name": proposed,
+        "match_method": "human_approved",
+        "match_confidence": 1.0,
+        "ontology_tag": ontology_tag,
+        "meta_type": meta_type,
+    }
+
+
+def _rejection_stub(raw_name: str, org_type: str) -> Dict:
+    """Stub entry for a pending item whose proposed match was rejected."""
+    return build_stub(MatchResult(raw_name=raw_name, org_type_classified=org_type))
+
+
 def page_pending_reviews(db: OntologyDB, sidecars: List[Dict]) -> None:
     st.header("Pending Match Reviews")
     st.caption(
@@ -185,9 +533,41 @@ def page_pending_reviews(db: OntologyDB, sidecars: List[Dict]) -> None:
         return
 
     st.metric("Pending Reviews", len(pending))
+
+    with st.expander("Batch approve", expanded=False):
+        min_pct = st.slider("Minimum match confidence (%)", 50, 100, 85)
+        eligible = [
+            item for item in pending
+            if item.get("proposed_match_canonical")
+            and (item.get("proposed_match_confidence") or 0.0) >= min_pct / 100
+        ]
+        if st.button(
+            f"Approve all {len(eligible)} at ≥ {min_pct}%",
+            key="batch_approve",
+            disabled=not eligible,
+        ):
+            approved = sum(
+                update_sidecar_link(
+                    item.get("_sidecar_file_path", ""), item.get("raw_name", ""),
+                    _approval_updates(db, item), defer_write=True,
+                )
+                for item in eligible
+            )
+            # One write per touched sidecar, however many links it had
+            try:
+                flush_sidecar_writes()
+            except (json.JSONDecodeError, OSError) as e:
+                st.error(f"Approved {approved} in memory but the write failed: {e}")
+            else:
+                st.success(f"Approved {approved} of {len(eligible)} matches.")
+                st.rerun()
+
     st.divider()
 
-    for i, item in enumerate(pending):
+    page_items, offset = _paginate(pending, "pending_page")
+
+    # i stays the global queue position so widget keys don't shift between pages
+    for i, item in enumerate(page_items, start=offset):
         raw_name = item.get("raw_name", "")
         proposed = item.get("proposed_match_canonical", "")
         confidence = item.get("proposed_match_confidence") or 0.0
@@ -210,13 +590,15 @@ def page_pending_reviews(db: OntologyDB, sidecars: List[Dict]) -> None:
                 st.subheader("Proposed Match")
                 if proposed:
                     st.write(f"**{proposed}**")
-                    # Show the full ontology entry
-                    entry = db.lookup_canonical(proposed)
-                    if entry:
-                        with st.container():
-                            st.json(entry, expanded=False)
-                    else:
-                        st.warning("Proposed entry not found in ontology.")
+                    # Show the full ontology entry — looked up and rendered only
+                    # on request, since collapsed expanders still run their body
+                    if st.toggle("Show ontology entry", value=(i == 0), key=f"details_{i}"):
+                        entry = db.lookup_canonical(proposed)
+                        if entry:
+                            with st.container():
+                                _json_preview(entry, key=f"pending_{i}")
+                        else:
+                            st.warning("Proposed entry not found in ontology.")
                 else:
                     st.write("_(no proposed match)_")
 
@@ -225,25 +607,8 @@ def page_pending_reviews(db: OntologyDB, sidecars: List[Dict]) -> None:
 
             with col_a:
                 if st.button("Approve Match", key=f"approve_{i}", type="primary"):
-                    entry = db.lookup_canonical(proposed) if proposed else None
-                    ontology_tag = None
-                    meta_type = item.get("meta_type")
-                    if entry:
-                        from matcher import _get_ontology_tag
-                        ontology_tag = _get_ontology_tag(entry)
-                        meta_type = entry.get("meta_type", meta_type)
-
                     success = update_sidecar_link(
-                        sidecar_path, raw_name,
-                        {
-                            "matched": True,
-                            "needs_review": False,
-                            "canonical_name": proposed,
-                            "match_method": "human_approved",
-                            "match_confidence": 1.0,
-                            "ontology_tag": ontology_tag,
-                            "meta_type": meta_type,
-                        }
+                        sidecar_path, raw_name, _approval_updates(db, item),
                     )
                     if success:
                         st.success(f"Approved: {raw_name} → {proposed}")
@@ -255,14 +620,7 @@ def page_pending_reviews(db: OntologyDB, sidecars: List[Dict]) -> None:
                 if st.button("Reject → Create Stub", key=f"reject_{i}"):
                     # Create stub if it doesn't exist
                     if not db.lookup_canonical(raw_name):
-                        from run_matching import build_stub
-                        stub = build_stub({
-                            "raw_name": raw_name,
-                            "org_type_classified": org_type,
-                            "matched": False,
-                            "needs_review": False,
-                        })
-                        db.add_entry(stub)
+                        db.add_entry(_rejection_stub(raw_name, org_type))
                         reload_db()
 
                     update_sidecar_link(
@@ -312,12 +670,59 @@ def _save_proposals(stub: Dict, proposals: Dict) -> None:
 
 def _field_val(proposals: Optional[Dict], stub: Dict, field: str, default: str = "") -> str:
     """Return proposal value if available, else stub value, else default."""
-    if proposals and field in proposals and proposals[field] is not None:
-        return str(proposals[field])
+    if proposals:
+        val = proposals.get(field)
+        if val is not None:
+            return str(val)
     val = stub.get(field)
     return str(val) if val is not None else default
 
 
+class _NameIndex(NamedTuple):
+    names: Tuple[str, ...]            # confirmed canonical names, in ontology order
+    lowered: Tuple[str, ...]          # names[i].lower()
+    trigrams: Dict[str, Set[int]]     # 3-gram of a lowered name -> name positions
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _confirmed_name_index(version: int) -> _NameIndex:
+    """
+    Lowercased confirmed-org names plus a trigram index, built once per DB
+    version and shared by every stub's search boxes. A cache_resource rather
+    than cache_data: the index is read-only and copying it per call would cost
+    more than the scan it replaces.
+    """
+    names = tuple(e.get("canonical_name", "") for e in get_confirmed_orgs(get_db()))
+    lowered = tuple(n.lower() for n in names)
+    trigrams: Dict[str, Set[int]] = {}
+    for i, low in enumerate(lowered):
+        for j in range(len(low) - 2):
+            trigrams.setdefault(low[j:j + 3], set()).add(i)
+    return _NameIndex(names, lowered, trigrams)
+
+
+def _search_names(index: _NameIndex, query: str, limit: int) -> List[str]:
+    """
+    First `limit` names containing query (case-insensitive), in ontology order.
+    Queries of 3+ characters only verify names that share all of their trigrams.
+    """
+    q = query.lower()
+    if len(q) >= 3:
+        postings = [index.trigrams.get(q[j:j + 3]) for j in range(len(q) - 2)]
+        if not all(postings):
+            return []
+        candidates = sorted(set.intersection(*postings))
+    else:
+        candidates = range(len(index.names))
+    out = []
+    for i in candidates:
+        if q in index.lowered[i]:
+            out.append(index.names[i])
+            if len(out) == limit:
+                break
+    return out
+
+
 def page_stub_review(db: OntologyDB) -> None:
     st.header("Stub Review")
     st.caption(
@@ -328,16 +733,19 @@ def page_stub_review(db: OntologyDB) -> None:
 
     # Filter controls
     all_stubs = db.get_stubs()
-    # Exclude merged and dismissed from the active queue
-    stubs = [
-        s for s in all_stubs
-        if s.get("status") not in ("merged", "dismissed", "completed")
-    ]
-
-    dismissed_count = sum(1 for s in all_stubs if s.get("status") == "dismissed")
-    merged_count = sum(1 for s in all_stubs if s.get("status") == "merged")
-    approved_count = sum(1 for s in all_stubs if s.get("status") == "completed"
-                         and s.get("source") == "auto_stub_approved")
+    # Exclude merged and dismissed from the active queue, counting them as we go
+    stubs = []
+    dismissed_count = merged_count = approved_count = 0
+    for s in all_stubs:
+        status = s.get("status")
+        if status == "dismissed":
+            dismissed_count += 1
+        elif status == "merged":
+            merged_count += 1
+        elif status == "completed":
+            approved_count += s.get("source") == "auto_stub_approved"
+        else:
+            stubs.append(s)
 
     col_m1, col_m2, col_m3, col_m4 = st.columns(4)
     col_m1.metric("Pending", len(stubs))
@@ -362,35 +770,47 @@ def page_stub_review(db: OntologyDB) -> None:
         with filter_col3:
             filter_enriched = st.checkbox("Show enriched only")
 
-    # Apply filters
-    display_stubs = stubs
-    if filter_meta:
-        display_stubs = [s for s in display_stubs if s.get("meta_type") in filter_meta]
-    if filter_text:
-        ft = filter_text.lower()
-        display_stubs = [s for s in display_stubs
-                         if ft in s.get("canonical_name", "").lower()]
-    if filter_enriched:
-        display_stubs = [s for s in display_stubs
-                         if f"proposals_{_stub_key(s)}" in st.session_state]
+    # Apply filters in one pass
+    meta_set = frozenset(filter_meta)
+    ft = filter_text.lower()
+    if meta_set or ft or filter_enriched:
+        display_stubs = [
+            s for s in stubs
+            if (not meta_set or s.get("meta_type") in meta_set)
+            and (not ft or ft in s.get("canonical_name", "").lower())
+            and (not filter_enriched or f"proposals_{_stub_key(s)}" in st.session_state)
+        ]
+    else:
+        display_stubs = stubs
 
     st.caption(f"Showing {len(display_stubs)} of {len(stubs)} pending stubs")
     st.divider()
 
-    # Build confirmed-org list once for the link autocomplete
-    confirmed_orgs = get_confirmed_orgs(db)
-    confirmed_names = [e.get("canonical_name", "") for e in confirmed_orgs]
+    # Confirmed-org names for the link / parent autocompletes
+    name_index = _confirmed_name_index(db_version())
 
     meta_type_options = ["io", "gov", "university", "ngo", "private", "other"]
 
-    for stub in display_stubs:
+    page_stubs, _ = _paginate(display_stubs, "stub_page")
+
+    for stub in page_stubs:
         skey = _stub_key(stub)  # stable unique key based on canonical_name
         cname = stub.get("canonical_name", "")
         proposals = _get_proposals(stub)
         conf = proposals.get("confidence", 0.0) if proposals else 0.0
         enriched_label = f"  {_confidence_badge(conf)} enriched" if proposals else ""
 
-        with st.expander(f"{cname}{enriched_label}", expanded=False):
+        # Only the opened stub builds its widgets; a collapsed st.expander would
+        # still run every input, lookup and preview below on each rerun
+        if st.session_state.get("open_stub") != skey:
+            col_label, col_open = st.columns([6, 1])
+            col_label.markdown(f"**{cname}**{enriched_label}")
+            if col_open.button("Open", key=f"open_{skey}"):
+                st.session_state["open_stub"] = skey
+                st.rerun()
+            continue
+
+        with st.expander(f"{cname}{enriched_label}", expanded=True):
 
             # ── Section A: Link to existing org ──────────────────────────────
             st.subheader("Link to Existing Organization")
@@ -406,11 +826,7 @@ def page_stub_review(db: OntologyDB) -> None:
 
             matching_confirmed = []
             if link_search and len(link_search) >= 2:
-                ls_lower = link_search.lower()
-                matching_confirmed = [
-                    n for n in confirmed_names
-                    if ls_lower in n.lower()
-                ][:15]
+                matching_confirmed = _search_names(name_index, link_search, 15)
 
             if matching_confirmed:
                 link_target = st.selectbox(
@@ -526,8 +942,10 @@ def page_stub_review(db: OntologyDB) -> None:
                 existing_vars = stub.get("variations_found", [])
                 proposed_vars = proposals.get("variations_found", []) if proposals else []
                 merged_vars = existing_vars[:]
+                seen_vars = set(existing_vars)
                 for v in proposed_vars:
-                    if v and v not in merged_vars and v != cname:
+                    if v and v not in seen_vars and v != cname:
+                        seen_vars.add(v)
                         merged_vars.append(v)
 
                 variations_text = st.text_area(
@@ -549,11 +967,7 @@ def page_stub_review(db: OntologyDB) -> None:
                 new_parent_org = parent_search  # default to typed value
 
                 if parent_search and len(parent_search) >= 2:
-                    ps_lower = parent_search.lower()
-                    parent_matches = [
-                        n for n in confirmed_names
-                        if ps_lower in n.lower()
-                    ][:10]
+                    parent_matches = _search_names(name_index, parent_search, 10)
                     if parent_matches:
                         selected_parent = st.selectbox(
                             f"{len(parent_matches)} match(es)",
@@ -583,7 +997,7 @@ def page_stub_review(db: OntologyDB) -> None:
                 final_tag = suggested_tag  # default to AI suggestion
 
                 if tag_prefix and len(tag_prefix.strip()) >= 2:
-                    suggestions = db.get_tag_completions(tag_prefix.strip())
+                    suggestions = _cached_tag_completions(tag_prefix.strip(), db_version())
                     if suggestions:
                         options = ["(type custom below)"] + suggestions[:25]
                         selected = st.selectbox(
@@ -643,9 +1057,9 @@ def page_stub_review(db: OntologyDB) -> None:
                     }
 
                     if final_tag:
-                        parsed_tags = _parse_tags(final_tag)
+                        parsed_tags = list(_parse_tags(final_tag))
                         primary_tag = _canonical_tag_from_tags(parsed_tags)
-                        htags = build_hierarchical_tags(final_tag)
+                        htags = list(build_hierarchical_tags(final_tag))
                         if new_meta_type in ("io", "university"):
                             updates["un_ontology"] = {
                                 "canonical_tag": primary_tag,
@@ -698,6 +1112,87 @@ def page_stub_review(db: OntologyDB) -> None:
 # Page 3: Ontology Browser
 # ─────────────────────────────────────────────────────────────────────────────
 
+_TABLE_COLUMNS = ["Name", "Meta Type", "Sector", "Country", "Tag", "Variations", "Source", "Status"]
+
+
+def _row_buckets(values: Sequence) -> Dict[object, np.ndarray]:
+    """Map each distinct value to the (ascending) row positions holding it."""
+    rows: Dict[object, List[int]] = {}
+    for i, value in enumerate(values):
+        rows.setdefault(value, []).append(i)
+    return {value: np.array(idx, dtype=np.intp) for value, idx in rows.items()}
+
+
+def _browser_snapshot(all_entries) -> Dict:
+    """
+    Derived browser data for one ontology snapshot, memoized in session_state:
+    a DataFrame with one row per entry (the Table view's columns plus a
+    lowercased name/variations search blob joined by \\x1f), the sorted
+    sidebar filter options, and per-column {value: row positions} buckets
+    so a selection touches only its matching rows.
+    db.get_all() hands back the same tuple until the next write, so the memo
+    is reused for as long as that exact snapshot is current.
+    """
+    memo = st.session_state.get("browser_opts")
+    if memo is not None and memo["entries"] is all_entries:
+        return memo
+    # Column-wise lists: pandas builds each column directly instead of
+    # inferring the schema from one dict per row
+    names, metas, sectors, countries = [], [], [], []
+    tags, n_vars, sources, statuses, blobs = [], [], [], [], []
+    for e in all_entries:
+        un = e.get("un_ontology") or {}
+        gov = e.get("gov_ontology") or {}
+        names.append(e.get("canonical_name", ""))
+        metas.append(e.get("meta_type", ""))
+        sectors.append(e.get("sector", ""))
+        countries.append(e.get("location_country") or "")
+        tags.append(un.get("canonical_tag") or gov.get("canonical_tag") or "")
+        n_vars.append(len(e.get("variations_found", [])))
+        sources.append(e.get("source", ""))
+        statuses.append(e.get("status", ""))
+        blobs.append("\x1f".join(
+            [e.get("canonical_name") or ""]
+            + [v or "" for v in e.get("variations_found", ())]
+        ).lower())
+    buckets = {
+        column: _row_buckets(values)
+        for column, values in (
+            ("Meta Type", metas),
+            ("Sector", sectors),
+            ("Country", countries),
+            ("Source", sources),
+        )
+    }
+    frame = pd.DataFrame({
+        "Name": names,
+        "Meta Type": metas,
+        "Sector": sectors,
+        "Country": countries,
+        "Tag": tags,
+        "Variations": n_vars,
+        "Source": sources,
+        "Status": statuses,
+        "_blob": blobs,
+    })
+    memo = {
+        "entries": all_entries,
+        "frame": frame,
+        # From the plain lists: pandas may hold missing values as NaN (truthy)
+        "meta_types": sorted(set(filter(None, metas))),
+        "sectors": sorted(set(filter(None, sectors))),
+        "countries": sorted(set(filter(None, countries))),
+        "sources": sorted(set(filter(None, sources))),
+        "buckets": buckets,
+        "stub_rows": np.flatnonzero([
+            src == "auto_stub" or status == "pending_review"
+            for src, status in zip(sources, statuses)
+        ]),
+    }
+    st.session_state["browser_opts"] = memo
+    return memo
+
+
 def page_ontology_browser(db: OntologyDB) -> None:
     st.header("Ontology Browser")
 
@@ -707,28 +1202,14 @@ def page_ontology_browser(db: OntologyDB) -> None:
     with st.sidebar:
         st.subheader("Filters")
 
-        available_meta_types = sorted(set(
-            e.get("meta_type", "") for e in all_entries if e.get("meta_type")
-        ))
-        filter_meta_type = st.multiselect(
-            "Meta Type", options=available_meta_types
-        )
-
-        available_sectors = sorted(set(
-            e.get("sector", "") for e in all_entries if e.get("sector")
-        ))
-        filter_sector = st.multiselect("Sector", options=available_sectors)
-
-        available_countries = sorted(set(
-            e.get("location_country", "") or ""
-            for e in all_entries
-        ) - {""})
-        filter_country = st.multiselect("Country", options=available_countries)
+        snap = _browser_snapshot(all_entries)
 
-        filter_source = st.multiselect(
-            "Source",
-            options=sorted(set(e.get("source", "") for e in all_entries if e.get("source")))
+        filter_meta_type = st.multiselect(
+            "Meta Type", options=snap["meta_types"]
         )
+        filter_sector = st.multiselect("Sector", options=snap["sectors"])
+        filter_country = st.multiselect("Country", options=snap["countries"])
+        filter_source = st.multiselect("Source", options=snap["sources"])
 
         filter_text = st.text_input(
             "Search name / alias",
@@ -741,28 +1222,42 @@ def page_ontology_browser(db: OntologyDB) -> None:
         view_mode = st.radio("View mode", ["Table", "Cards"])
 
     # ── Apply filters ─────────────────────────────────────────────────────────
-    filtered = all_entries
-
-    if filter_meta_type:
-        filtered = [e for e in filtered if e.get("meta_type") in filter_meta_type]
-    if filter_sector:
-        filtered = [e for e in filtered if e.get("sector") in filter_sector]
-    if filter_country:
-        filtered = [e for e in filtered if e.get("location_country") in filter_country]
-    if filter_source:
-        filtered = [e for e in filtered if e.get("source") in filter_source]
+    # One boolean mask over the snapshot rows. Value filters mark the rows in
+    # their selected buckets; the text search then only scans surviving rows.
+    frame = snap["frame"]
+    buckets = snap["buckets"]
+    mask = None
+    for column, selected in (
+        ("Meta Type", filter_meta_type),
+        ("Sector", filter_sector),
+        ("Country", filter_country),
+        ("Source", filter_source),
+    ):
+        if selected:
+            hit = np.zeros(len(frame), dtype=bool)
+            for value in selected:
+                rows = buckets[column].get(value)
+                if rows is not None:
+                    hit[rows] = True
+            mask = hit if mask is None else mask & hit
+    if filter_stubs_only:
+        hit = np.zeros(len(frame), dtype=bool)
+        hit[snap["stub_rows"]] = True
+        mask = hit if mask is None else mask & hit
     if filter_text:
         ft = filter_text.lower()
-        filtered = [
-            e for e in filtered
-            if ft in (e.get("canonical_name") or "").lower()
-            or any(ft in (v or "").lower() for v in e.get("variations_found", []))
-        ]
-    if filter_stubs_only:
-        filtered = [
-            e for e in filtered
-            if e.get("source") == "auto_stub" or e.get("status") == "pending_review"
-        ]
+        if mask is None:
+            mask = frame["_blob"].str.contains(ft, regex=False).to_numpy(dtype=bool)
+        else:
+            rows = np.flatnonzero(mask)
+            mask[rows] = (
+                frame["_blob"].iloc[rows].str.contains(ft, regex=False).to_numpy(dtype=bool)
+            )
+
+    if mask is None:
+        filtered = all_entries
+    else:
+        filtered = [all_entries[i] for i in np.flatnonzero(mask)]
 
     col_m1, col_m2, col_m3 = st.columns(3)
     col_m1.metric("Showing", len(filtered))
@@ -773,25 +1268,9 @@ def page_ontology_browser(db: OntologyDB) -> None:
 
     # ── Table view ────────────────────────────────────────────────────────────
     if view_mode == "Table":
-        import pandas as pd
-
-        rows = []
-        for e in filtered:
-            un = e.get("un_ontology") or {}
-            gov = e.get("gov_ontology") or {}
-            tag = un.get("canonical_tag") or gov.get("canonical_tag") or ""
-            rows.append({
-                "Name": e.get("canonical_name", ""),
-                "Meta Type": e.get("meta_type", ""),
-                "Sector": e.get("sector", ""),
-                "Country": e.get("location_country") or "",
-                "Tag": tag,
-                "Variations": len(e.get("variations_found", [])),
-                "Source": e.get("source", ""),
-                "Status": e.get("status", ""),
-            })
-
-        df = pd.DataFrame(rows)
+        df = frame[_TABLE_COLUMNS]
+        if mask is not None:
+            df = df[mask].reset_index(drop=True)
         st.dataframe(df, use_container_width=True, height=550)
 
     # ── Cards view ────────────────────────────────────────────────────────────
@@ -811,7 +1290,7 @@ def page_ontology_browser(db: OntologyDB) -> None:
                 col1, col2 = st.columns([2, 2])
 
                 with col1:
-                    st.json(entry, expanded=False)
+                    _json_preview(entry, key=f"browser_{cname}")
 
                 with col2:
                     st.subheader("Edit Variations")
@@ -869,17 +1348,21 @@ def render_sidebar_stats(db: OntologyDB, sidecars: List[Dict]) -> str:
     all_entries = db.get_all()
     pending_stubs = db.get_pending_stubs()
 
-    match_review_count = sum(
-        1 for s in sidecars
-        for l in s.get("org_links", [])
-        if l.get("needs_review")
-    )
+    match_review_count = sum(s.get("review_needed_count", 0) for s in sidecars)
 
     st.sidebar.metric("Ontology Entries", len(all_entries))
     st.sidebar.metric("Stubs Pending", len(pending_stubs))
     st.sidebar.metric("Match Reviews", match_review_count)
     st.sidebar.metric("Sidecar Files", len(sidecars))
 
+    n_buffered = len(_write_buffer().files)
+    if n_buffered and st.sidebar.button(f"Flush changes ({n_buffered} file(s))"):
+        try:
+            flush_sidecar_writes()
+            st.rerun()
+        except (json.JSONDecodeError, OSError) as e:
+            st.sidebar.error(f"Flush failed: {e}")
+
     return page
 
 
@@ -32,7 +32,7 @@ from classifiers import (
     CATEGORY_TO_META_TYPE,
 )
 from matcher import OrgMatcher, MATCHING_CONFIG, MatchResult
-from ontology_db import OntologyDB
+from ontology_db import OntologyDB, get_db
 
 # ─────────────────────────────────────────────────────────────────────────────
 # File discovery
@@ -90,21 +90,21 @@ def collect_org_names(career_events: List[Dict]) -> List[str]:
 def _result_to_org_link(result: MatchResult, stub_created: bool = False) -> Dict:
     """Convert a MatchResult to a sidecar org_link dict."""
     link = {
-        "raw_name": result["raw_name"],
-        "canonical_name": result.get("matched_canonical"),
-        "match_method": result.get("match_method"),
-        "match_confidence": result.get("match_confidence"),
-        "ontology_tag": result.get("ontology_tag"),
-        "meta_type": result.get("meta_type"),
-        "matched": result["matched"],
-        "needs_review": result.get("needs_review", False),
-        "org_type_classified": result.get("org_type_classified", "other"),
+        "raw_name": result.raw_name,
+        "canonical_name": result.matched_canonical,
+        "match_method": result.match_method,
+        "match_confidence": result.match_confidence,
+        "ontology_tag": result.ontology_tag,
+        "meta_type": result.meta_type,
+        "matched": result.matched,
+        "needs_review": result.needs_review,
+        "org_type_classified": result.org_type_classified,
         "stub_created": stub_created,
     }
     # Include proposed match info for review queue
-    if result.get("needs_review"):
-        link["proposed_match_canonical"] = result.get("proposed_match_canonical")
-        link["proposed_match_confidence"] = result.get("proposed_match_confidence")
+    if result.needs_review:
+        link["proposed_match_canonical"] = result.proposed_match_canonical
+        link["proposed_match_confidence"] = result.proposed_match_confidence
     return link
 
 
@@ -118,19 +118,19 @@ def build_sidecar(
 
     Args:
         person_name: the person's name
-        match_results: list of MatchResult dicts (one per unique org)
+        match_results: list of MatchResult (one per unique org)
         stub_flags: {raw_name -> stub_created bool}
     """
     org_links = [
-        _result_to_org_link(r, stub_created=stub_flags.get(r["raw_name"], False))
+        _result_to_org_link(r, stub_created=stub_flags.get(r.raw_name, False))
         for r in match_results
     ]
     return {
         "person_name": person_name,
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "total_orgs": len(org_links),
-        "matched_count": sum(1 for r in match_results if r["matched"]),
-        "review_needed_count": sum(1 for r in match_results if r.get("needs_review")),
+        "matched_count": sum(1 for r in match_results if r.matched),
+        "review_needed_count": sum(1 for r in match_results if r.needs_review),
         "stubs_created_count": sum(1 for v in stub_flags.values() if v),
         "org_links": org_links,
     }
@@ -156,9 +156,9 @@ def save_sidecar(sidecar: Dict, timeline_file_path: Path) -> Path:
 
 def build_stub(result: MatchResult) -> Dict:
     """Build a stub ontology entry for an unmatched organization."""
-    org_type = result.get("org_type_classified", "other")
+    org_type = result.org_type_classified
     return {
-        "canonical_name": result["raw_name"],
+        "canonical_name": result.raw_name,
         "org_types": CATEGORY_TO_ORG_TYPES.get(org_type, ["other"]),
         "variations_found": [],
         "meta_type": CATEGORY_TO_META_TYPE.get(org_type, "other"),
@@ -187,10 +187,10 @@ def collect_stubs(
 
     for _person_name, results in all_results:
         for result in results:
-            raw = result["raw_name"]
+            raw = result.raw_name
             if (
-                not result["matched"]
-                and not result.get("needs_review")
+                not result.matched
+                and not result.needs_review
                 and raw not in stub_names
                 and db.lookup_canonical(raw) is None
             ):
@@ -225,8 +225,8 @@ def process_person(
         results = matcher.match_person(person_name, career_events)
 
         if verbose:
-            matched = sum(1 for r in results if r["matched"])
-            review = sum(1 for r in results if r.get("needs_review"))
+            matched = sum(1 for r in results if r.matched)
+            review = sum(1 for r in results if r.needs_review)
             total = len(results)
             logging.info(
                 f"  {person_name}: {total} orgs | "
@@ -262,8 +262,8 @@ def print_summary(
 
     for person_name, results in all_results:
         n = len(results)
-        matched = sum(1 for r in results if r["matched"])
-        review = sum(1 for r in results if r.get("needs_review"))
+        matched = sum(1 for r in results if r.matched)
+        review = sum(1 for r in results if r.needs_review)
         unmatched = n - matched - review
         print(f"{person_name:<30} {n:>5} {matched:>8} {review:>8} {unmatched:>10}")
         total_orgs += n
@@ -362,7 +362,7 @@ def main() -> None:
     logging.info(f"Processing {len(all_files)} person(s)...")
 
     # Initialize shared objects (OntologyDB is read-safe for concurrent access)
-    db = OntologyDB()
+    db = get_db()
     matcher = OrgMatcher(config=config, db=db)
 
     logging.info(f"Ontology loaded: {db.count()} entries")
@@ -0,0 +1,142 @@
+"""
+Tests for llm_disambiguate_batch with a stubbed Anthropic client.
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+pytest.importorskip("dotenv")
+
+import llm_match
+from llm_match import _disambiguation_cache_key, llm_disambiguate_batch
+
+
+class _StubStream:
+    def __init__(self, text):
+        self.text_stream = iter([text])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _StubMessages:
+    def __init__(self, text):
+        self.text = text
+        self.prompts = []
+
+    def create(self, messages, **kwargs):
+        self.prompts.append(messages[0]["content"])
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+    def stream(self, messages, **kwargs):
+        self.prompts.append(messages[0]["content"])
+        return _StubStream(self.text)
+
+
+@pytest.fixture
+def stub_llm(tmp_path, monkeypatch):
+    """Install a fresh cache and a client answering with the given text."""
+    monkeypatch.setattr(llm_match, "_cache", llm_match._LLMCache(tmp_path / "cache.sqlite"))
+    monkeypatch.setattr(llm_match, "is_available", lambda api_key=None: True)
+
+    def install(text):
+        messages = _StubMessages(text)
+        monkeypatch.setattr(
+            llm_match, "_get_client", lambda api_key=None: SimpleNamespace(messages=messages)
+        )
+        return messages
+
+    return install
+
+
+def _items():
+    return [
+        ("UNDP", [{"canonical_name": "UN Development Programme"},
+                  {"canonical_name": "UNEP"}]),
+        ("World Bank Group", [{"canonical_name": "World Bank"}]),
+        ("Min. of Finance", [{"canonical_name": "Ministry of Finance"}]),
+        ("OECD", [{"canonical_name": "OECD"}]),
+    ]
+
+
+def _cached(raw_name, candidates):
+    hit = llm_match._cache.get(_disambiguation_cache_key(raw_name, candidates, None))
+    return None if hit is None else json.loads(hit)
+
+
+def test_partial_batch_response_caches_only_valid_answers(stub_llm):
+    items = _items()
+    stub_llm(json.dumps([
+        {"raw_name_index": 0, "best_match_index": 0, "confidence": 0.9},
+        {"raw_name_index": 0, "best_match_index": 1, "confidence": 0.9},  # duplicate
+        {"raw_name_index": 1, "best_match_index": 0, "confidence": "high"},  # malformed
+        {"raw_name_index": 2, "best_match_index": None, "confidence": 0.0},
+        {"raw_name_index": 9, "best_match_index": 0, "confidence": 1.0},  # out of range
+        "not an object",
+        # item 3 never answered
+    ]))
+
+    results = llm_disambiguate_batch(items)
+
+    assert results[0] == (items[0][1][0], 0.9)
+    assert results[1] is None and results[2] is None and results[3] is None
+    assert _cached(*items[0]) == {"canonical_name": "UN Development Programme",
+                                  "confidence": 0.9}
+    assert _cached(*items[2]) == {"canonical_name": None}  # a definite "no match"
+    assert _cached(*items[1]) is None  # malformed: asked again next time
+    assert _cached(*items[3]) is None  # unanswered: asked again next time
+
+
+def test_cached_items_are_not_resent(stub_llm):
+    items = _items()
+    llm_match._cache.put(
+        _disambiguation_cache_key(*items[0], None),
+        {"canonical_name": "UNEP", "confidence": 0.8},
+    )
+    llm_match._cache.put(_disambiguation_cache_key(*items[1], None), {"canonical_name": None})
+    messages = stub_llm(json.dumps([
+        {"raw_name_index": 0, "best_match_index": 0, "confidence": 0.7},
+        {"raw_name_index": 1, "best_match_index": 0, "confidence": 0.95},
+    ]))
+
+    results = llm_disambiguate_batch(items)
+
+    assert results == [
+        (items[0][1][1], 0.8),
+        None,
+        (items[2][1][0], 0.7),
+        (items[3][1][0], 0.95),
+    ]
+    (prompt,) = messages.prompts
+    assert '"Min. of Finance"' in prompt and '"OECD"' in prompt
+    assert '"UNDP"' not in prompt and '"World Bank Group"' not in prompt
+
+
+def test_unparseable_batch_response_caches_nothing(stub_llm):
+    items = _items()
+    stub_llm("Sorry, I can't help with that.")
+
+    assert llm_disambiguate_batch(items) == [None] * len(items)
+    assert all(_cached(*item) is None for item in items)
+
+
+def test_single_remaining_item_falls_back_to_llm_disambiguate(stub_llm):
+    items = _items()[:2]
+    llm_match._cache.put(_disambiguation_cache_key(*items[0], None), {"canonical_name": None})
+    messages = stub_llm('{"best_match_index": 0, "confidence": 0.85, "reasoning": "same org"}')
+
+    results = llm_disambiguate_batch(items)
+
+    assert results == [None, (items[1][1][0], 0.85)]
+    (prompt,) = messages.prompts
+    assert 'Raw organization name: "World Bank Group"' in prompt
+    assert _cached(*items[1]) == {"canonical_name": "World Bank", "confidence": 0.85}
@@ -0,0 +1,113 @@
+"""
+Tests for OntologyDB's incremental index maintenance.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from ontology_db import OntologyDB
+
+
+def _entry(name, variations=(), meta_type="io", tags=(), **extra):
+    entry = {
+        "canonical_name": name,
+        "variations_found": list(variations),
+        "meta_type": meta_type,
+        "un_ontology": {"hierarchical_tags": list(tags)} if tags else {},
+        "gov_ontology": {},
+    }
+    entry.update(extra)
+    return entry
+
+
+def _make_db(tmp_path, entries):
+    path = tmp_path / "unified_ontology.json"
+    path.write_text(json.dumps({"unified_ontology": entries}), encoding="utf-8")
+    return OntologyDB(path)
+
+
+def _index_state(db):
+    """Every index, with entries replaced by their list position."""
+    pos = {id(e): i for i, e in enumerate(db._entries)}
+
+    def positions(entries):
+        return [pos[id(e)] for e in entries]
+
+    return {
+        "canonical": {k: pos[id(e)] for k, e in db._canonical_index.items()},
+        "variation": {k: pos[id(e)] for k, e in db._variation_index.items()},
+        "meta_type": {m: positions(b) for m, b in db._meta_type_index.items()},
+        "canonical_claims": dict(db._canonical_claims),
+        "variation_claims": dict(db._variation_claims),
+        "tag_counts": dict(db._tag_counts),
+        "tags_lower": list(db._tags_lower),
+        "tags_orig": list(db._tags_orig),
+        "stubs": positions(db._stubs),
+        "pending_stubs": positions(db._pending_stubs),
+        "indexed": sorted(
+            (ix.position, [(k, idx is db._canonical_index) for idx, _c, k in ix.keys],
+             ix.meta_type, ix.tags)
+            for ix in db._indexed.values()
+        ),
+    }
+
+
+def _assert_matches_rebuild(db):
+    incremental = _index_state(db)
+    db._build_indexes()
+    assert incremental == _index_state(db)
+
+
+def test_incremental_indexes_match_full_rebuild(tmp_path):
+    db = _make_db(tmp_path, [
+        _entry("UNDP", ["United Nations Development Programme"], tags=["un/undp"]),
+        _entry("World Bank", ["IBRD", "WB"], meta_type="io", tags=["ifi/wb"]),
+        _entry("Ministry of Finance", ["MoF"], meta_type="gov"),
+    ])
+    db.count()  # load
+
+    # Adds, including a duplicate canonical name and shared variations
+    db.add_entry(_entry("undp", ["UNDP Office"], tags=["un/undp"]), defer_write=True)
+    db.add_entries([
+        _entry("IMF", ["WB"], tags=["ifi/imf"]),
+        _entry("Acme", ["MoF"], meta_type="private",
+               source="auto_stub", status="pending_review"),
+    ], defer_write=True)
+    _assert_matches_rebuild(db)
+    assert db.lookup_canonical("UNDP")["variations_found"] == ["UNDP Office"]
+    assert db.lookup_variation("wb")["canonical_name"] == "IMF"
+
+    # Updates: rename away from a shared key, drop variations, change
+    # meta_type/tags, and move a stub out of the pending queue
+    db.update_entry("UNDP", {"canonical_name": "UN Development Programme"}, defer_write=True)
+    db.update_entry("IMF", {"variations_found": [], "un_ontology": {}}, defer_write=True)
+    db.update_entry("Acme", {"status": "dismissed", "meta_type": "ngo"}, defer_write=True)
+    _assert_matches_rebuild(db)
+    assert db.lookup_canonical("undp")["variations_found"] == ["United Nations Development Programme"]
+    assert db.lookup_variation("WB")["canonical_name"] == "World Bank"
+    assert db.get_pending_stubs() == []
+
+    # Removals: the last claimant of a key gives it up
+    db.update_entry("World Bank", {"variations_found": ["IBRD"]}, defer_write=True)
+    db.update_entry("Acme", {"variations_found": []}, defer_write=True)
+    db.update_entry("World Bank", {"un_ontology": {}}, defer_write=True)
+    _assert_matches_rebuild(db)
+    assert db.lookup_variation("WB") is None
+    assert db.lookup_variation("MoF")["canonical_name"] == "Ministry of Finance"
+    assert db.get_tag_completions("ifi") == []
+
+
+def test_update_after_in_place_mutation_unindexes_old_keys(tmp_path):
+    db = _make_db(tmp_path, [
+        _entry("OECD", ["Organisation for Economic Co-operation"]),
+        _entry("OECD Secretariat", ["Organisation for Economic Co-operation"]),
+    ])
+    entry = db.lookup_canonical("OECD Secretariat")
+    entry["variations_found"].append("OECD-S")  # mutated before update_entry
+    db.update_entry("OECD Secretariat", {"canonical_name": "OECD Sec."}, defer_write=True)
+    _assert_matches_rebuild(db)
+    assert db.lookup_canonical("OECD Secretariat") is None
+    assert db.lookup_variation("oecd-s")["canonical_name"] == "OECD Sec."
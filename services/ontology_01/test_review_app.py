@@ -0,0 +1,163 @@
+"""
+Tests for the review app's Reject → Create Stub path and sidecar write buffer.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+pytest.importorskip("streamlit")
+pytest.importorskip("rapidfuzz")
+
+import review_app
+from review_app import _rejection_stub, flush_sidecar_writes, update_sidecar_link
+
+
+def test_rejection_stub_uses_classified_type():
+    stub = _rejection_stub("World Health Organisation", "un_system")
+    assert stub["canonical_name"] == "World Health Organisation"
+    assert stub["org_types"] == ["international_organization"]
+    assert stub["meta_type"] == "io"
+    assert stub["source"] == "auto_stub"
+    assert stub["status"] == "pending_review"
+
+
+def test_rejection_stub_unknown_type_falls_back_to_other():
+    stub = _rejection_stub("Some Foundation", "not_a_category")
+    assert stub["org_types"] == ["other"]
+    assert stub["meta_type"] == "other"
+
+
+# ── Sidecar write buffer ──────────────────────────────────────────────────────
+
+APPROVE = {"matched": True, "needs_review": False, "match_method": "human_approved"}
+REJECT = {"matched": False, "needs_review": False, "stub_created": True}
+
+
+@pytest.fixture(autouse=True)
+def fresh_buffer():
+    """Each test starts with an empty write buffer and sidecar cache."""
+    review_app._write_buffer.clear()
+    review_app._sidecar_cache.clear()
+    yield
+    review_app._write_buffer.clear()
+    review_app._sidecar_cache.clear()
+
+
+def _link(raw_name, matched=False, needs_review=True):
+    return {"raw_name": raw_name, "matched": matched, "needs_review": needs_review}
+
+
+def _write_sidecar(path, links, counts=True):
+    data = {"person_name": path.stem, "org_links": links}
+    if counts:
+        data["matched_count"] = sum(bool(l["matched"]) for l in links)
+        data["review_needed_count"] = sum(bool(l["needs_review"]) for l in links)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _links_by_name(data):
+    return {l["raw_name"]: l for l in data["org_links"]}
+
+
+def _assert_counts_match_rescan(data):
+    links = data["org_links"]
+    assert data["matched_count"] == sum(bool(l.get("matched")) for l in links)
+    assert data["review_needed_count"] == sum(bool(l.get("needs_review")) for l in links)
+
+
+def test_flush_replays_edits_onto_externally_rewritten_sidecar(tmp_path):
+    path = tmp_path / "A_org_links.json"
+    _write_sidecar(path, [_link("UNDP"), _link("IMF")])
+    assert update_sidecar_link(str(path), "UNDP", APPROVE, defer_write=True)
+
+    # run_matching rewrites the file before the buffer is flushed
+    _write_sidecar(path, [_link("UNDP"), _link("IMF", matched=True, needs_review=False),
+                          _link("OECD")])
+
+    assert flush_sidecar_writes() == 1
+    links = _links_by_name(_read(path))
+    assert set(links) == {"UNDP", "IMF", "OECD"}
+    assert links["UNDP"]["match_method"] == "human_approved"
+    assert links["IMF"]["matched"] is True  # the external change survives
+    _assert_counts_match_rescan(_read(path))
+
+
+def test_update_after_external_rewrite_replays_buffered_edits(tmp_path):
+    path = tmp_path / "A_org_links.json"
+    _write_sidecar(path, [_link("UNDP"), _link("IMF")])
+    assert update_sidecar_link(str(path), "UNDP", APPROVE, defer_write=True)
+
+    _write_sidecar(path, [_link("UNDP"), _link("IMF"), _link("OECD")])
+    assert update_sidecar_link(str(path), "OECD", REJECT, defer_write=True)
+
+    # The next rerun sees both edits on top of the new file, without a flush
+    (_stamp, cached) = review_app._sidecar_cache()[str(path)]
+    links = _links_by_name(cached)
+    assert links["UNDP"]["matched"] is True and links["OECD"]["stub_created"] is True
+
+    flush_sidecar_writes()
+    links = _links_by_name(_read(path))
+    assert links["UNDP"]["matched"] is True
+    assert links["OECD"]["stub_created"] is True
+    assert links["IMF"]["needs_review"] is True
+
+
+@pytest.mark.parametrize("counts", [True, False])
+def test_delta_counts_match_full_rescan(tmp_path, counts):
+    path = tmp_path / "A_org_links.json"
+    _write_sidecar(path, [
+        _link("UNDP"), _link("IMF"), _link("OECD"),
+        _link("WHO", matched=True, needs_review=False),
+    ], counts=counts)
+
+    edits = [
+        ("UNDP", APPROVE),
+        ("IMF", REJECT),
+        ("UNDP", APPROVE),                      # double-click: no change
+        ("WHO", {"matched": False, "needs_review": True}),
+        ("UNDP", {"matched": False}),
+        ("missing", APPROVE),                   # no such link
+    ]
+    for raw_name, updates in edits:
+        update_sidecar_link(str(path), raw_name, updates, defer_write=True)
+        _assert_counts_match_rescan(review_app._sidecar_cache()[str(path)][1])
+
+    flush_sidecar_writes()
+    _assert_counts_match_rescan(_read(path))
+
+
+def test_flush_writes_each_dirty_file_once(tmp_path, monkeypatch):
+    paths = [tmp_path / f"{name}_org_links.json" for name in ("A", "B", "C")]
+    for path in paths:
+        _write_sidecar(path, [_link("UNDP"), _link("IMF"), _link("OECD")])
+
+    writes = []
+    real_write = review_app._write_sidecar_atomic
+
+    def counting_write(path, data):
+        writes.append(path)
+        real_write(path, data)
+
+    monkeypatch.setattr(review_app, "_write_sidecar_atomic", counting_write)
+
+    for path in paths[:2]:  # C is never edited
+        for raw_name in ("UNDP", "IMF", "OECD"):
+            update_sidecar_link(str(path), raw_name, APPROVE, defer_write=True)
+    assert writes == []
+
+    assert flush_sidecar_writes() == 2
+    assert sorted(writes) == sorted(paths[:2])
+    for path in paths[:2]:
+        assert all(l["matched"] for l in _read(path)["org_links"])
+
+    assert flush_sidecar_writes() == 0
+    assert len(writes) == 2